@@ -20,6 +20,7 @@ This module is allowed to read:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 
@@ -60,6 +61,7 @@ class AppConfig:
 # Loader
 # ============================================================================
 
+@cache
 def load_config() -> AppConfig:
     """
     Load HVACgooee configuration.
@@ -67,6 +69,10 @@ def load_config() -> AppConfig:
     v1 behaviour:
     - hard-coded defaults
     - file/env support can be added later
+
+    Read ONCE: the first call builds the config, later calls return
+    the same object (project_root is the cwd at first call).
+    Tests may reset via load_config.cache_clear().
     """
 
     project = ProjectConfig(
@@ -8,25 +8,31 @@ Single source of truth for:
 - Reference HVAC constants
 
 NO calculations live here.
+
+All values are typing.Final — import them by name
+(`from HVAC.constants.thermal import SHC_AIR`) so hot loops read a
+global, not a module attribute.
 """
 
+from typing import Final
+
 # ------------------------------------------------------------------
 # Specific Heat Capacity (J/kg·K)
 # ------------------------------------------------------------------
 
-SHC_WATER = 4180.0        # Liquid water (hydronics)
-SHC_AIR = 1005.0          # Dry air @ ~20°C
-SHC_STEAM = 2010.0        # (future use)
+SHC_WATER: Final[float] = 4180.0        # Liquid water (hydronics)
+SHC_AIR: Final[float] = 1005.0          # Dry air @ ~20°C
+SHC_STEAM: Final[float] = 2010.0        # (future use)
 
 # ------------------------------------------------------------------
 # Densities (kg/m³) — for ventilation / flow
 # ------------------------------------------------------------------
 
-DENSITY_WATER = 1000.0
-DENSITY_AIR = 1.204       # @ 20°C, sea level
+DENSITY_WATER: Final[float] = 1000.0
+DENSITY_AIR: Final[float] = 1.204       # @ 20°C, sea level
 
 # ------------------------------------------------------------------
 # HVAC reference constants
 # ------------------------------------------------------------------
 
-SECONDS_PER_HOUR = 3600.0
+SECONDS_PER_HOUR: Final[float] = 3600.0
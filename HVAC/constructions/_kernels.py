@@ -0,0 +1,72 @@
+# ======================================================================
+# HVAC/constructions/_kernels.py
+# ======================================================================
+
+"""
+HVACgooee — Construction Kernels (internal)
+------------------------------------------
+
+Scalar float kernels shared by construction adapters.
+
+RULES (LOCKED)
+--------------
+• Floats in, float out
+• No validation (callers validate first)
+• No DTOs, no dataclasses, no imports from HVAC
+
+THREADING POLICY (LOCKED)
+-------------------------
+Kernels here work on a handful of layers (< 1k elements). They stay
+single-threaded and side-effect free:
+
+• No threads, pools or parallel loops inside a kernel
+• If a JIT is ever introduced, no parallel=True / prange —
+  at this size thread start-up costs more than the arithmetic
+• Parallelism belongs to the caller (e.g. one process per zone)
+
+COMPILATION POLICY (LOCKED)
+---------------------------
+Kernels here and in the engines (window _ug_kernel, roof
+roof_u_value_packed) are plain Python: no Numba, no JIT, no AOT
+extension modules. Cold start is module import only, so CLI /
+wizard runs pay no first-call compile cost and nothing needs a
+compiled fallback.
+"""
+
+from __future__ import annotations
+
+
+def _brick_stud_u(
+    r_brick: float,
+    r_stud: float,
+    r_ins: float,
+    r_pb: float,
+    f_ins: float,
+    f_stud: float,
+    rsi: float,
+    rse: float,
+) -> float:
+    """
+    Parallel-path (area-weighted) U-value for a brick outer /
+    insulated stud inner wall:
+
+        R_total = f_ins·R_path_ins + f_stud·R_path_stud
+
+    Each path is summed in full (rsi + brick + layer + pb + rse), in
+    that order. Factoring the shared layers out is algebraically equal
+    only when f_ins + f_stud == 1 exactly; callers accept a 1e-6
+    tolerance on that sum, and even exact fractions round differently,
+    so the original two-path form is kept.
+
+    Returns 0.0 if the total resistance is not positive; the caller
+    decides how to report that.
+    """
+    r_path_ins = rsi + r_brick + r_ins + r_pb + rse
+    r_path_stud = rsi + r_brick + r_stud + r_pb + rse
+
+    r_total = f_ins * r_path_ins + f_stud * r_path_stud
+
+    if r_total <= 0.0:
+        return 0.0
+
+    return 1.0 / r_total
@@ -0,0 +1,52 @@
+# ======================================================================
+# HVAC/constructions/adapters/_dto_pool.py
+# ======================================================================
+
+"""
+HVACgooee — U-value DTO Pool (constructions-private)
+---------------------------------------------------
+
+Flyweight for ConstructionUValueResultDTO, shared by the engine
+adapters and registry_v2 preset resolution.
+
+Identical (surface_class, construction_ref, u_value) triples share ONE
+immutable DTO while any caller still holds it. Entries vanish once
+unreferenced (weak values), so the pool never outgrows live results.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+from weakref import WeakValueDictionary
+
+from HVAC.constructions.construction_preset import SurfaceClass
+from HVAC.constructions.dto.construction_uvalue_result_dto import (
+    ConstructionUValueResultDTO,
+)
+
+
+_DTO_POOL: WeakValueDictionary[
+    Tuple[SurfaceClass, str, float], ConstructionUValueResultDTO
+] = WeakValueDictionary()
+
+
+def intern_uvalue_dto(
+    surface_class: SurfaceClass,
+    construction_ref: str,
+    u_value: float,
+) -> ConstructionUValueResultDTO:
+    """
+    Return the shared DTO for this triple, creating it on first use.
+    """
+    key = (surface_class, construction_ref, u_value)
+
+    dto = _DTO_POOL.get(key)
+    if dto is None:
+        dto = ConstructionUValueResultDTO(
+            surface_class=surface_class,
+            construction_ref=construction_ref,
+            u_value=u_value,
+        )
+        _DTO_POOL[key] = dto
+
+    return dto
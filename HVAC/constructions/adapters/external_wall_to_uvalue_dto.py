@@ -23,12 +23,15 @@ RULES (LOCKED)
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from HVAC.constructions.dto.construction_uvalue_result_dto import (
     ConstructionUValueResultDTO,
 )
+from HVAC.constructions.adapters._dto_pool import intern_uvalue_dto
 from HVAC.constructions.construction_preset import SurfaceClass
+from HVAC.constructions._kernels import _brick_stud_u
 
 
 # ----------------------------------------------------------------------
@@ -43,10 +46,12 @@ R_SE_WALL = 0.06
 # Internal layer representation (adapter-private)
 # ----------------------------------------------------------------------
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class _Layer:
     """
     Minimal thermal layer definition for adapter use ONLY.
+
+    Frozen (hashable) so identical build-ups share one cached U-value.
     """
     conductivity_w_mk: Optional[float]
     thickness_m: Optional[float]
@@ -85,49 +90,25 @@ def build_external_wall_brick_stud_uvalue_dto(
             f"  stud_fraction       = {stud_fraction}"
         )
 
-    # ------------------------------------------------------------
-    # Layer resistances
-    # ------------------------------------------------------------
-
-    r_brick = _layer_r_value(brick_layer)
-    r_stud = _layer_r_value(stud_layer)
-    r_insulation = _layer_r_value(insulation_layer)
-    r_plasterboard = _layer_r_value(plasterboard_layer)
-
-    # Insulation path
-    r_path_insulation = (
-        rsi
-        + r_brick
-        + r_insulation
-        + r_plasterboard
-        + rse
+    u_value = _u_brick_stud(
+        brick_layer,
+        stud_layer,
+        insulation_layer,
+        plasterboard_layer,
+        insulation_fraction,
+        stud_fraction,
+        rsi,
+        rse,
     )
 
-    # Stud path (thermal bridge)
-    r_path_stud = (
-        rsi
-        + r_brick
-        + r_stud
-        + r_plasterboard
-        + rse
-    )
-
-    # Area-weighted total resistance
-    r_total = (
-        insulation_fraction * r_path_insulation
-        + stud_fraction * r_path_stud
-    )
-
-    if r_total <= 0.0:
+    if u_value <= 0.0:
         raise ValueError("Computed wall resistance must be positive.")
 
-    u_value = 1.0 / r_total
-
     # ------------------------------------------------------------
     # DTO EMISSION (LOCKED)
     # ------------------------------------------------------------
 
-    return ConstructionUValueResultDTO(
+    return intern_uvalue_dto(
         surface_class=SurfaceClass.EXTERNAL_WALL,
         construction_ref=construction_id,
         u_value=u_value,
@@ -138,18 +119,51 @@ def build_external_wall_brick_stud_uvalue_dto(
 # Internal helpers
 # ----------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
+def _u_brick_stud(
+    brick: _Layer,
+    stud: _Layer,
+    insulation: _Layer,
+    plasterboard: _Layer,
+    f_ins: float,
+    f_stud: float,
+    rsi: float,
+    rse: float,
+) -> float:
+    """
+    Cached brick / stud U-value.
+
+    Deterministic in its inputs, so surfaces sharing a construction
+    evaluate it once. Returns 0.0 for a non-positive total resistance.
+    """
+    # One pass over the four layers (order matches _brick_stud_u)
+    r_brick, r_stud, r_insulation, r_plasterboard = map(
+        _layer_r_value, (brick, stud, insulation, plasterboard)
+    )
+
+    return _brick_stud_u(
+        r_brick,
+        r_stud,
+        r_insulation,
+        r_plasterboard,
+        f_ins,
+        f_stud,
+        rsi,
+        rse,
+    )
+
+
 def _layer_r_value(layer: _Layer) -> float:
     """
     Return thermal resistance of a layer.
 
-    Missing or invalid data ⇒ R = 0.0 (explicit).
+    Missing (None) or non-positive data ⇒ R = 0.0 (explicit).
+    NaN is neither, so it propagates: a NaN thickness or conductivity
+    gives a NaN U-value rather than a plausible finite one.
     """
-    if (
-        layer.conductivity_w_mk is None
-        or layer.thickness_m is None
-        or layer.conductivity_w_mk <= 0.0
-        or layer.thickness_m <= 0.0
-    ):
+    t = layer.thickness_m
+    k = layer.conductivity_w_mk
+    if t is None or k is None or k <= 0.0 or t <= 0.0:
         return 0.0
 
-    return layer.thickness_m / layer.conductivity_w_mk
+    return t / k
@@ -7,6 +7,7 @@ from __future__ import annotations
 from HVAC.constructions.dto.construction_uvalue_result_dto import (
     ConstructionUValueResultDTO,
 )
+from HVAC.constructions.adapters._dto_pool import intern_uvalue_dto
 from HVAC.constructions.construction_preset import SurfaceClass
 
 
@@ -27,7 +28,7 @@ def build_flat_roof_uvalue_dto(
     if u_value <= 0.0:
         raise ValueError("Flat roof u_value must be positive.")
 
-    return ConstructionUValueResultDTO(
+    return intern_uvalue_dto(
         surface_class=SurfaceClass.ROOF,
         construction_ref=construction_id,
         u_value=u_value,
@@ -4,14 +4,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from HVAC.constructions.dto.construction_uvalue_result_dto import (
     ConstructionUValueResultDTO,
 )
+from HVAC.constructions.adapters._dto_pool import intern_uvalue_dto
 from HVAC.constructions.construction_preset import SurfaceClass
-from HVAC.constructions.engines.pitched_roof_calculator import (
-    compute_roof_performance,
-    PitchedRoof,
-)
+
+if TYPE_CHECKING:
+    from HVAC.constructions.engines.pitched_roof_calculator import PitchedRoof
 
 
 def build_pitched_roof_uvalue_dto(
@@ -28,10 +30,15 @@ def build_pitched_roof_uvalue_dto(
     • Ignores comfort-adjusted variants
     """
 
+    # Deferred: engine loads only when a pitched roof is built
+    from HVAC.constructions.engines.pitched_roof_calculator import (
+        compute_roof_performance,
+    )
+
     result = compute_roof_performance(roof)
-    u_value = result["U_value"]
+    u_value = result.U_value
 
-    return ConstructionUValueResultDTO(
+    return intern_uvalue_dto(
         surface_class=SurfaceClass.ROOF,
         construction_ref=construction_id,
         u_value=u_value,
@@ -4,14 +4,18 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from HVAC.constructions.dto.construction_uvalue_result_dto import (
     ConstructionUValueResultDTO,
 )
+from HVAC.constructions.adapters._dto_pool import intern_uvalue_dto
 from HVAC.constructions.construction_preset import SurfaceClass
-from HVAC.constructions.engines.window_calculation_engine import (
-    WindowConstruction,
-    compute_window_performance,
-)
+
+if TYPE_CHECKING:
+    from HVAC.constructions.engines.window_calculation_engine import (
+        WindowConstruction,
+    )
 
 
 def build_window_uvalue_dto(
@@ -30,6 +34,11 @@ def build_window_uvalue_dto(
     • No frame breakdown
     """
 
+    # Deferred: engine loads only when a window is built
+    from HVAC.constructions.engines.window_calculation_engine import (
+        compute_window_performance,
+    )
+
     result = compute_window_performance(
         construction=construction,
         width_m=width_m,
@@ -38,7 +47,7 @@ def build_window_uvalue_dto(
 
     u_value = result.Uw_W_m2K
 
-    return ConstructionUValueResultDTO(
+    return intern_uvalue_dto(
         surface_class=SurfaceClass.WINDOW,
         construction_ref=construction_id,
         u_value=u_value,
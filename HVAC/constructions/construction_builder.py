@@ -30,17 +30,19 @@ Design Rules
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, Optional, Sequence, Tuple
 
 
 # ---------------------------------------------------------------------------
 # Data Structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConstructionLayer:
     """
     Represents a single layer in a construction.
+
+    Immutable: a layer's physics never changes once built.
     """
     name: str
     thickness_m: float
@@ -49,10 +51,13 @@ class ConstructionLayer:
     specific_heat_J_kgK: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Construction:
     """
     Represents an entire wall/floor/roof construction.
+
+    Mutable for builder ergonomics (layers may be appended);
+    engines read it and must not modify it.
     """
     layers: List[ConstructionLayer] = field(default_factory=list)
 
@@ -64,6 +69,54 @@ class Construction:
 
     mode: str = "advanced"                      # simple/advanced/educational
 
+    @classmethod
+    def from_arrays(
+        cls,
+        names: Sequence[str],
+        thickness_m: Sequence[float],
+        conductivity_W_mK: Sequence[float],
+        density_kg_m3: Optional[Sequence[Optional[float]]] = None,
+        specific_heat_J_kgK: Optional[Sequence[Optional[float]]] = None,
+        **kwargs,
+    ) -> "Construction":
+        """
+        Build from parallel per-layer columns (row i = layer i).
+
+        Inverse of layer_arrays(); remaining Construction fields are
+        passed through as keyword arguments.
+        """
+        n = len(names)
+        if density_kg_m3 is None:
+            density_kg_m3 = (None,) * n
+        if specific_heat_J_kgK is None:
+            specific_heat_J_kgK = (None,) * n
+
+        layers = [
+            ConstructionLayer(name, float(t), float(k), rho, c)
+            for name, t, k, rho, c in zip(
+                names,
+                thickness_m,
+                conductivity_W_mK,
+                density_kg_m3,
+                specific_heat_J_kgK,
+                strict=True,
+            )
+        ]
+        return cls(layers=layers, **kwargs)
+
+    def layer_arrays(self) -> Dict[str, List]:
+        """
+        Layers as parallel columns keyed by ConstructionLayer field name.
+        """
+        layers = self.layers
+        return {
+            "name": [L.name for L in layers],
+            "thickness_m": [L.thickness_m for L in layers],
+            "conductivity_W_mK": [L.conductivity_W_mK for L in layers],
+            "density_kg_m3": [L.density_kg_m3 for L in layers],
+            "specific_heat_J_kgK": [L.specific_heat_J_kgK for L in layers],
+        }
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -86,14 +139,64 @@ def parallel_path_resistance(
         - insulation path
         - bridging path (timber/steel)
     """
-    R_ins = sum(layer_resistance(L) for L in layers)
-    R_bridge = sum(L.thickness_m / bridging_k for L in layers)
+    return _row_resistances(
+        ((L.thickness_m, L.conductivity_W_mK) for L in layers),
+        bridging_k,
+        bridging_fraction,
+    )[2]
+
+
+def _row_resistances(
+    layers_tk: Iterable[Tuple[float, float]],
+    bridging_k: float,
+    f: float,
+) -> Tuple[float, Optional[float], float]:
+    """
+    Single pass over one construction's (thickness, conductivity) pairs.
 
-    f = bridging_fraction
+    Returns (R_ins, R_bridge, R_layers); R_bridge is None if f <= 0.
+    Both paths are summed layer by layer (Σ t/k, Σ t/k_b), so the
+    scalar, batch and diagnostic paths reproduce the original
+    per-layer sums exactly.
+    """
+    R_ins = 0.0
     if f <= 0:
-        return R_ins
+        for t, k in layers_tk:
+            R_ins += t / k
+        return R_ins, None, R_ins
+
+    R_bridge = 0.0
+    for t, k in layers_tk:
+        R_ins += t / k
+        R_bridge += t / bridging_k
+
+    return R_ins, R_bridge, 1.0 / ((f / R_bridge) + ((1 - f) / R_ins))
+
+
+def _resistances(
+    con: Construction,
+) -> Tuple[float, Optional[float], float, float, float]:
+    """
+    Full decomposition of a construction:
+        (R_ins, R_bridge, R_parallel, R_total, U)
+
+    Bridging applies only outside "simple" mode.
+    """
+    f = 0.0 if con.mode == "simple" else con.bridging_fraction
+
+    R_ins, R_bridge, R_parallel = _row_resistances(
+        ((L.thickness_m, L.conductivity_W_mK) for L in con.layers),
+        con.bridging_conductivity,
+        f,
+    )
+
+    R_total = (
+        con.internal_surface_resistance
+        + R_parallel
+        + con.external_surface_resistance
+    )
 
-    return 1.0 / ((f / R_bridge) + ((1 - f) / R_ins))
+    return R_ins, R_bridge, R_parallel, R_total, 1.0 / R_total
 
 
 # ---------------------------------------------------------------------------
@@ -105,26 +208,56 @@ def construction_u_value(con: Construction) -> float:
     Calculate U-value for a layered construction.
     Applies bridging if mode = advanced/educational.
     """
-    # Surface resistance (internal)
-    R_total = con.internal_surface_resistance
-
-    # Layers
-    if con.mode == "simple" or con.bridging_fraction == 0:
-        R_layers = sum(layer_resistance(l) for l in con.layers)
-    else:
-        R_layers = parallel_path_resistance(
-            con.layers,
-            con.bridging_fraction,
-            con.bridging_conductivity
-        )
+    return _resistances(con)[4]
+
+
+def construction_u_value_batch(
+    thickness: Sequence[Sequence[float]],
+    conductivity: Sequence[Sequence[float]],
+    bridging_k: Sequence[float],
+    f: Sequence[float],
+    rsi: float = 0.13,
+    rse: float = 0.04,
+) -> List[float]:
+    """
+    Calculate U-values for M constructions in one sweep.
+
+    Structure-of-arrays input (row m = construction m):
+        thickness[m][l]     layer thickness (m)
+        conductivity[m][l]  layer conductivity (W/mK)
+        bridging_k[m]       bridging conductivity (W/mK)
+        f[m]                bridging fraction (0–1; <= 0 ⇒ no bridging)
+
+    Per row:
+        R_ins    = Σ t / k
+        R_bridge = Σ t / k_b                       (only if f > 0)
+        R_layers = 1 / (f/R_bridge + (1-f)/R_ins)  (or R_ins)
+        U        = 1 / (rsi + R_layers + rse)
+    """
+    u_values: List[float] = []
 
-    R_total += R_layers
+    for t_row, k_row, k_b, f_m in zip(thickness, conductivity, bridging_k, f):
+        R_layers = _row_resistances(zip(t_row, k_row), k_b, f_m)[2]
+        u_values.append(1.0 / (rsi + R_layers + rse))
 
-    # Surface resistance (external)
-    R_total += con.external_surface_resistance
+    return u_values
 
-    U = 1.0 / R_total
-    return U
+
+def compile_construction(con: Construction) -> Callable[[float, float], float]:
+    """
+    Partially evaluate a construction for repeated heat-loss steps.
+
+    U is resolved ONCE here; the returned callable is:
+        q(area_m2, delta_t) = U · A · ΔT   (W)
+
+    The closure is a snapshot — recompile after editing `con`.
+    """
+    U = construction_u_value(con)
+
+    def q(area_m2: float, delta_t: float, _U: float = U) -> float:
+        return _U * area_m2 * delta_t
+
+    return q
 
 
 # ---------------------------------------------------------------------------
@@ -134,41 +267,31 @@ def construction_u_value(con: Construction) -> float:
 def diagnostic_construction_breakdown(con: Construction) -> Dict[str, float]:
     """
     Returns intermediate values for Educational mode.
+
+    Populated from the same decomposition as construction_u_value(),
+    so "U_value" here always equals construction_u_value(con).
     """
+    R_ins, R_bridge, R_parallel, R_total, U = _resistances(con)
+
     breakdown = {}
-    R_total = 0.0
 
     # Internal surface
     breakdown["R_internal_surface"] = con.internal_surface_resistance
-    R_total += con.internal_surface_resistance
 
     # Pure insulation path
-    R_ins_list = [layer_resistance(L) for L in con.layers]
-    breakdown["R_layers_insulation_path"] = sum(R_ins_list)
+    breakdown["R_layers_insulation_path"] = R_ins
 
     # Bridging path (if applicable)
-    if con.bridging_fraction > 0:
-        R_bridge_list = [
-            L.thickness_m / con.bridging_conductivity for L in con.layers
-        ]
-        breakdown["R_layers_bridged_path"] = sum(R_bridge_list)
-        R_parallel = parallel_path_resistance(
-            con.layers,
-            con.bridging_fraction,
-            con.bridging_conductivity
-        )
-        breakdown["R_effective_parallel"] = R_parallel
-        R_total += R_parallel
-    else:
-        breakdown["R_effective_parallel"] = breakdown["R_layers_insulation_path"]
-        R_total += breakdown["R_layers_insulation_path"]
+    if R_bridge is not None:
+        breakdown["R_layers_bridged_path"] = R_bridge
+
+    breakdown["R_effective_parallel"] = R_parallel
 
     # External surface
     breakdown["R_external_surface"] = con.external_surface_resistance
-    R_total += con.external_surface_resistance
 
     breakdown["R_total"] = R_total
-    breakdown["U_value"] = 1.0 / R_total
+    breakdown["U_value"] = U
 
     return breakdown
 
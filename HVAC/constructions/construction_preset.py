@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Literal
 
@@ -24,10 +25,26 @@ class SurfaceClass(str, Enum):
     DOOR = "door"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstructionPreset:
     ref: str
     name: str
     surface_class: SurfaceClass
     u_value: float
     preset_type: PresetType
+
+    # Derived: u_value present and positive (checked once, not per resolve)
+    _valid_u: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned to match ConstructionVariant.preset_ref on lookup
+        object.__setattr__(self, "ref", sys.intern(self.ref))
+        object.__setattr__(
+            self,
+            "_valid_u",
+            self.u_value is not None and self.u_value > 0.0,
+        )
+
+    def __hash__(self) -> int:
+        # ref is unique per preset; str hashes are cached by CPython
+        return hash(self.ref)
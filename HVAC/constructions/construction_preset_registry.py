@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List
+import os
+from array import array
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Tuple
 
 from HVAC.constructions.construction_preset import (
     ConstructionPreset,
@@ -8,6 +11,11 @@ from HVAC.constructions.construction_preset import (
 )
 
 
+# Trusted callers (e.g. packaged default presets) may opt out of the
+# per-preset type check; `python -O` removes it entirely.
+_SKIP_PRESET_VALIDATION = bool(os.getenv("HVAC_SKIP_PRESET_VALIDATION"))
+
+
 class ConstructionPresetRegistry:
     """
     Read-only registry of ConstructionPreset objects.
@@ -22,33 +30,110 @@ class ConstructionPresetRegistry:
     No GUI logic
     """
 
-    def __init__(self, presets: List[ConstructionPreset]):
-        if not isinstance(presets, list):
-            raise TypeError(
-                "ConstructionPresetRegistry expects List[ConstructionPreset]"
-            )
+    def __init__(self, presets: Iterable[ConstructionPreset]):
+        presets = tuple(presets)
 
-        for p in presets:
-            if not isinstance(p, ConstructionPreset):
-                raise TypeError(
-                    f"Invalid preset supplied: {p!r}"
-                )
+        if __debug__ and not _SKIP_PRESET_VALIDATION:
+            for p in presets:
+                if not isinstance(p, ConstructionPreset):
+                    raise TypeError(
+                        f"Invalid preset supplied: {p!r}"
+                    )
 
-        self._by_ref: Dict[str, ConstructionPreset] = {
+        by_ref: Dict[str, ConstructionPreset] = {
             p.ref: p for p in presets
         }
 
+        # SurfaceClass index (built once, read-only)
+        by_surface: Dict[SurfaceClass, List[ConstructionPreset]] = {}
+        for p in by_ref.values():
+            by_surface.setdefault(p.surface_class, []).append(p)
+
+        # All lookup tables are exposed as read-only views
+        self._by_ref: Mapping[str, ConstructionPreset] = MappingProxyType(by_ref)
+        self._by_surface: Mapping[
+            SurfaceClass, Tuple[ConstructionPreset, ...]
+        ] = MappingProxyType(
+            {sc: tuple(items) for sc, items in by_surface.items()}
+        )
+
+        # Hot-path lookup bound once to the underlying dict
+        self._get_preset: Callable[[str], ConstructionPreset] = by_ref.__getitem__
+
+        # Parallel (SoA) columns over the unique presets, row i ↔ preset i.
+        # Numeric lanes for aggregate queries; objects stay authoritative.
+        unique = tuple(by_ref.values())
+        self._refs: Tuple[str, ...] = tuple(p.ref for p in unique)
+        self._surface_classes: Tuple[SurfaceClass, ...] = tuple(
+            p.surface_class for p in unique
+        )
+        # None U-values are stored as NaN (array('d') is float-only)
+        self._u_values = array(
+            "d",
+            (float("nan") if p.u_value is None else p.u_value for p in unique),
+        )
+        self._index: Mapping[str, int] = MappingProxyType(
+            {ref: i for i, ref in enumerate(self._refs)}
+        )
+
+        surface_indices: Dict[SurfaceClass, List[int]] = {}
+        for i, sc in enumerate(self._surface_classes):
+            surface_indices.setdefault(sc, []).append(i)
+        self._surface_indices: Mapping[
+            SurfaceClass, Tuple[int, ...]
+        ] = MappingProxyType(
+            {sc: tuple(idx) for sc, idx in surface_indices.items()}
+        )
+
+        # SurfaceClass → bitset over rows (bit i set ⇔ row i matches)
+        surface_mask: Dict[SurfaceClass, int] = {}
+        for sc, idx in self._surface_indices.items():
+            mask = 0
+            for i in idx:
+                mask |= 1 << i
+            surface_mask[sc] = mask
+        self._surface_mask: Mapping[SurfaceClass, int] = MappingProxyType(
+            surface_mask
+        )
+
     def get(self, ref: str) -> ConstructionPreset:
-        return self._by_ref[ref]
+        return self._get_preset(ref)
 
     def list_for_surface(
             self, surface_class: SurfaceClass
-    ) -> List[ConstructionPreset]:
-        return [
-            p for p in self._by_ref.values()
-            if p.surface_class == surface_class
-            #if p.surface_class == surface_class
-        ]
+    ) -> Tuple[ConstructionPreset, ...]:
+        return self._by_surface.get(surface_class, ())
+
+    def u_values_for_surface(self, surface_class: SurfaceClass) -> array:
+        """
+        U-values of a SurfaceClass's presets as a packed float array
+        (registry order; NaN where u_value is None).
+
+        Read straight from the U-value column — e.g. min()/sum() for
+        GUI summaries without touching preset objects.
+        """
+        u = self._u_values
+        return array(
+            "d", (u[i] for i in self._surface_indices.get(surface_class, ()))
+        )
 
+    def list_for_surfaces(
+            self, surface_classes: Iterable[SurfaceClass]
+    ) -> Tuple[ConstructionPreset, ...]:
+        """
+        Presets matching ANY of the given SurfaceClasses (registry order).
 
+        Union of per-surface bitsets, then one walk over the set bits.
+        """
+        surface_mask = self._surface_mask
+        mask = 0
+        for sc in surface_classes:
+            mask |= surface_mask.get(sc, 0)
 
+        by_ref, refs = self._by_ref, self._refs
+        out: List[ConstructionPreset] = []
+        while mask:
+            low = mask & -mask
+            out.append(by_ref[refs[low.bit_length() - 1]])
+            mask ^= low
+        return tuple(out)
@@ -20,12 +20,18 @@ Hierarchy:
         → Family
             → Variant
                 → preset_ref
+
+Flat view:
+    ConstructionTreeSoA packs the same tree into parallel columns
+    (one row per variant) for scans / filtering. Build it from a
+    ConstructionTree; the nested tree stays the authored form.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
 
 from HVAC.constructions.construction_preset import SurfaceClass
@@ -35,18 +41,23 @@ from HVAC.constructions.construction_preset import SurfaceClass
 # Core Nodes
 # ------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstructionVariant:
     """
     Leaf node.
 
     Holds exactly ONE reference to a ConstructionPreset (by ref).
+
+    preset_ref is interned: it is used as a registry dict key.
     """
     name: str
     preset_ref: str
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "preset_ref", sys.intern(self.preset_ref))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstructionFamily:
     """
     Groups similar construction variants.
@@ -57,23 +68,31 @@ class ConstructionFamily:
         "Metal Clad"
     """
     name: str
-    variants: List[ConstructionVariant]
+    variants: Tuple[ConstructionVariant, ...]
 
+    def __post_init__(self) -> None:
+        # name is part of the (SurfaceClass, family) index key
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "variants", tuple(self.variants))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ConstructionSurfaceGroup:
     """
     Root grouping for a SurfaceClass.
     """
     surface_class: SurfaceClass
-    families: List[ConstructionFamily]
+    families: Tuple[ConstructionFamily, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "families", tuple(self.families))
 
 
 # ------------------------------------------------------------------
 # Tree Container
 # ------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConstructionTree:
     """
     Canonical Construction Tree (v1).
@@ -83,6 +102,22 @@ class ConstructionTree:
     """
     surfaces: Dict[SurfaceClass, ConstructionSurfaceGroup]
 
+    # (SurfaceClass, family name) → variants, built once
+    _variants_index: Dict[
+        Tuple[SurfaceClass, str], Tuple[ConstructionVariant, ...]
+    ] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        index: Dict[
+            Tuple[SurfaceClass, str], Tuple[ConstructionVariant, ...]
+        ] = {}
+        for surface_class, group in self.surfaces.items():
+            for fam in group.families:
+                # First family with a given name wins (as the old scan did)
+                index.setdefault((surface_class, fam.name), fam.variants)
+
+        object.__setattr__(self, "_variants_index", index)
+
     # --------------------------------------------------------------
     # Query helpers (GUI-safe)
     # --------------------------------------------------------------
@@ -92,19 +127,99 @@ class ConstructionTree:
 
     def list_families(
         self, surface_class: SurfaceClass
-    ) -> List[ConstructionFamily]:
+    ) -> Tuple[ConstructionFamily, ...]:
         group = self.surfaces.get(surface_class)
-        return group.families if group else []
+        return group.families if group else ()
 
     def list_variants(
         self, surface_class: SurfaceClass, family_name: str
-    ) -> List[ConstructionVariant]:
-        group = self.surfaces.get(surface_class)
-        if not group:
-            return []
+    ) -> Tuple[ConstructionVariant, ...]:
+        return self._variants_index.get((surface_class, family_name), ())
+
+
+# ------------------------------------------------------------------
+# Flat (columnar) view
+# ------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class ConstructionTreeSoA:
+    """
+    Columnar view of a ConstructionTree.
+
+    One row per variant; row i is:
+        (surface_class[i], family_name[i], variant_name[i], preset_ref[i])
+
+    Rows keep tree order (surface → family → variant).
+    """
+    surface_class: Tuple[SurfaceClass, ...]
+    family_name: Tuple[str, ...]
+    variant_name: Tuple[str, ...]
+    preset_ref: Tuple[str, ...]
+
+    # SurfaceClass → row indices, built once
+    _rows_by_surface: Dict[SurfaceClass, Tuple[int, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        n = len(self.preset_ref)
+        if not (
+            len(self.surface_class) == len(self.family_name)
+            == len(self.variant_name) == n
+        ):
+            raise ValueError("ConstructionTreeSoA columns must be equal length")
+
+        rows: Dict[SurfaceClass, List[int]] = {}
+        for i, sc in enumerate(self.surface_class):
+            rows.setdefault(sc, []).append(i)
+
+        object.__setattr__(
+            self,
+            "_rows_by_surface",
+            {sc: tuple(idx) for sc, idx in rows.items()},
+        )
+
+    @classmethod
+    def from_tree(cls, tree: ConstructionTree) -> "ConstructionTreeSoA":
+        surface_class: List[SurfaceClass] = []
+        family_name: List[str] = []
+        variant_name: List[str] = []
+        preset_ref: List[str] = []
+
+        for sc, group in tree.surfaces.items():
+            for fam in group.families:
+                for var in fam.variants:
+                    surface_class.append(sc)
+                    family_name.append(fam.name)
+                    variant_name.append(var.name)
+                    preset_ref.append(var.preset_ref)
+
+        return cls(
+            surface_class=tuple(surface_class),
+            family_name=tuple(family_name),
+            variant_name=tuple(variant_name),
+            preset_ref=tuple(preset_ref),
+        )
 
-        for fam in group.families:
-            if fam.name == family_name:
-                return fam.variants
+    # --------------------------------------------------------------
+    # Query helpers (GUI-safe)
+    # --------------------------------------------------------------
 
-        return []
+    def __len__(self) -> int:
+        return len(self.preset_ref)
+
+    def rows_for(self, surface_class: SurfaceClass) -> Tuple[int, ...]:
+        return self._rows_by_surface.get(surface_class, ())
+
+    def variants_for(
+        self, surface_class: SurfaceClass
+    ) -> Tuple[Tuple[str, str, str], ...]:
+        """
+        (family_name, variant_name, preset_ref) rows for a SurfaceClass.
+        """
+        fam, var, ref = self.family_name, self.variant_name, self.preset_ref
+        return tuple((fam[i], var[i], ref[i]) for i in self.rows_for(surface_class))
+
+    def preset_refs_for(self, surface_class: SurfaceClass) -> Tuple[str, ...]:
+        ref = self.preset_ref
+        return tuple(ref[i] for i in self.rows_for(surface_class))
@@ -5,110 +5,54 @@ default_construction_presets_v2.py
 HVACgooee — Default Construction Presets (v2, v3-compatible)
 
 Conservative, orthodox, steady-state effective U-values.
+
+Rows follow ConstructionPreset field order:
+    (ref, name, surface_class, u_value, preset_type)
 """
 
+from typing import Final, Tuple
+
 from HVAC.constructions.construction_preset import (
     ConstructionPreset,
     SurfaceClass,
 )
 
 
-DEFAULT_CONSTRUCTION_PRESETS_V2 = [
+_PRESET_ROWS: Final[Tuple[tuple, ...]] = (
 
     # ------------------------
     # External Walls
     # ------------------------
-    ConstructionPreset(
-        ref="EXT_WALL_SOLID_LEGACY",
-        name="Solid masonry wall (uninsulated)",
-        surface_class=SurfaceClass.EXTERNAL_WALL,
-        u_value=2.1,
-        preset_type="reference",
-    ),
-    ConstructionPreset(
-        ref="EXT_WALL_CAVITY_PART_FILL",
-        name="Cavity wall (partial fill)",
-        surface_class=SurfaceClass.EXTERNAL_WALL,
-        u_value=0.6,
-        preset_type="reference",
-    ),
-    ConstructionPreset(
-        ref="EXT_WALL_MODERN_INSULATED",
-        name="Modern insulated external wall",
-        surface_class=SurfaceClass.EXTERNAL_WALL,
-        u_value=0.18,
-        preset_type="reference",
-    ),
+    ("EXT_WALL_SOLID_LEGACY", "Solid masonry wall (uninsulated)", SurfaceClass.EXTERNAL_WALL, 2.1, "reference"),
+    ("EXT_WALL_CAVITY_PART_FILL", "Cavity wall (partial fill)", SurfaceClass.EXTERNAL_WALL, 0.6, "reference"),
+    ("EXT_WALL_MODERN_INSULATED", "Modern insulated external wall", SurfaceClass.EXTERNAL_WALL, 0.18, "reference"),
 
     # ------------------------
     # Internal Walls
     # ------------------------
-    ConstructionPreset(
-        ref="INT_WALL_STANDARD",
-        name="Standard internal partition",
-        surface_class=SurfaceClass.INTERNAL_WALL,
-        u_value=1.5,
-        preset_type="reference",
-    ),
-    ConstructionPreset(
-        ref="INT_WALL_ADIABATIC",
-        name="Internal wall (adiabatic)",
-        surface_class=SurfaceClass.INTERNAL_WALL,
-        u_value=0.0,
-        preset_type="reference",
-    ),
+    ("INT_WALL_STANDARD", "Standard internal partition", SurfaceClass.INTERNAL_WALL, 1.5, "reference"),
+    ("INT_WALL_ADIABATIC", "Internal wall (adiabatic)", SurfaceClass.INTERNAL_WALL, 0.0, "reference"),
 
     # ------------------------
     # Roofs
     # ------------------------
-    ConstructionPreset(
-        ref="ROOF_UNINSULATED",
-        name="Uninsulated roof",
-        surface_class=SurfaceClass.ROOF,
-        u_value=2.3,
-        preset_type="reference",
-    ),
-    ConstructionPreset(
-        ref="ROOF_MODERN_INSULATION",
-        name="Modern insulated roof",
-        surface_class=SurfaceClass.ROOF,
-        u_value=0.18,
-        preset_type="reference",
-    ),
+    ("ROOF_UNINSULATED", "Uninsulated roof", SurfaceClass.ROOF, 2.3, "reference"),
+    ("ROOF_MODERN_INSULATION", "Modern insulated roof", SurfaceClass.ROOF, 0.18, "reference"),
 
     # ------------------------
     # Floors
     # ------------------------
-    ConstructionPreset(
-        ref="FLOOR_SOLID_UNINSULATED",
-        name="Uninsulated solid floor",
-        surface_class=SurfaceClass.FLOOR,
-        u_value=0.7,
-        preset_type="reference",
-    ),
-    ConstructionPreset(
-        ref="FLOOR_SOLID_INSULATED",
-        name="Insulated solid floor",
-        surface_class=SurfaceClass.FLOOR,
-        u_value=0.25,
-        preset_type="reference",
-    ),
+    ("FLOOR_SOLID_UNINSULATED", "Uninsulated solid floor", SurfaceClass.FLOOR, 0.7, "reference"),
+    ("FLOOR_SOLID_INSULATED", "Insulated solid floor", SurfaceClass.FLOOR, 0.25, "reference"),
 
     # ------------------------
     # Windows
     # ------------------------
-    ConstructionPreset(
-        ref="WINDOW_SINGLE_LEGACY",
-        name="Single glazing (legacy)",
-        surface_class=SurfaceClass.WINDOW,
-        u_value=5.6,
-        preset_type="reference",
-    ),
-    ConstructionPreset(
-        ref="WINDOW_DOUBLE_LEGACY",
-        name="Double glazing (legacy)",
-        surface_class=SurfaceClass.WINDOW,
-        u_value=2.8,
-        preset_type="reference",
-    ),
-]
+    ("WINDOW_SINGLE_LEGACY", "Single glazing (legacy)", SurfaceClass.WINDOW, 5.6, "reference"),
+    ("WINDOW_DOUBLE_LEGACY", "Double glazing (legacy)", SurfaceClass.WINDOW, 2.8, "reference"),
+)
+
+
+DEFAULT_CONSTRUCTION_PRESETS_V2: Final[Tuple[ConstructionPreset, ...]] = tuple(
+    ConstructionPreset(*row) for row in _PRESET_ROWS
+)
@@ -6,10 +6,14 @@ HVACgooee — Default Construction Tree v1 (LOCKED)
 
 Conservative, UK-centric starter tree.
 Small by design. Extend later via version bump.
+
+The nested literal below is the authored form; the columnar view
+(ConstructionTreeSoA) is packed from it on demand.
 """
 
 from HVAC.constructions.construction_tree import (
     ConstructionTree,
+    ConstructionTreeSoA,
     ConstructionSurfaceGroup,
     ConstructionFamily,
     ConstructionVariant,
@@ -127,3 +131,7 @@ def build_default_construction_tree() -> ConstructionTree:
             ),
         }
     )
+
+
+def build_default_construction_tree_soa() -> ConstructionTreeSoA:
+    return ConstructionTreeSoA.from_tree(build_default_construction_tree())
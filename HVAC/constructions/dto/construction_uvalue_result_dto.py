@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from HVAC.constructions.construction_preset import SurfaceClass
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class ConstructionUValueResultDTO:
     """
     Canonical construction U-value result.
@@ -13,8 +13,15 @@ class ConstructionUValueResultDTO:
     • One surface, one resolved U-value
     • Serializable
     • Immutable
+    • Weak-referenceable (adapters intern identical results)
+    • Hashed on identity (surface_class, construction_ref) only;
+      equality still compares all fields, including u_value
     """
 
     surface_class: SurfaceClass
     construction_ref: str   # stable ID (preset.ref or engine ref)
     u_value: float           # W/m²·K
+
+    def __hash__(self) -> int:
+        # Stable cache key: no float in the hash
+        return hash((self.surface_class, self.construction_ref))
@@ -22,8 +22,8 @@ Used by:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, List, Dict, NamedTuple, Optional, Sequence, Tuple
 import math
 
 # ---------------------------------------------------------------------------
@@ -45,6 +45,23 @@ PITCH_RSE_FACTOR = {
     75: 1.25,
 }
 
+# Sorted breakpoints, built once (interpolate_pitch_factor hot path)
+_PITCH_KEYS = tuple(sorted(PITCH_RSE_FACTOR))
+_PITCH_VALS = tuple(PITCH_RSE_FACTOR[k] for k in _PITCH_KEYS)
+
+# Breakpoints are evenly spaced, so the segment index is pitch // step.
+# Per segment: (start pitch, factor at start, factor rise over segment)
+_PITCH_STEP = _PITCH_KEYS[1] - _PITCH_KEYS[0]
+if any(b - a != _PITCH_STEP for a, b in zip(_PITCH_KEYS, _PITCH_KEYS[1:])):
+    raise ValueError("PITCH_RSE_FACTOR breakpoints must be evenly spaced.")
+
+_PITCH_SEGMENTS = tuple(
+    (_PITCH_KEYS[i], _PITCH_VALS[i], _PITCH_VALS[i + 1] - _PITCH_VALS[i])
+    for i in range(len(_PITCH_KEYS) - 1)
+)
+_PITCH_MIN, _PITCH_MAX = _PITCH_KEYS[0], _PITCH_KEYS[-1]
+_PITCH_FACTOR_MIN, _PITCH_FACTOR_MAX = _PITCH_VALS[0], _PITCH_VALS[-1]
+
 # Ventilated cavity resistance (cold roof) — typical fixed values
 R_VENTILATED_CAVITY = 0.20
 
@@ -59,6 +76,9 @@ LAMBDA = {
     "xps": 0.030,
 }
 
+# Hoisted: read on every between-rafters layer
+_LAM_RAFTERS = LAMBDA["rafters"]
+
 # Bridging fractions (fraction of rafter vs insulation area)
 BRIDGING = {
     "typical": 0.10,     # 10% rafter, 90% insulation
@@ -78,32 +98,137 @@ THERMAL_MASS = {
 # DATA STRUCTURES
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RoofLayer:
     """
     Represents one layer in the roof construction.
     thickness_m: thickness in metres
     material: key referencing LAMBDA dict
     position: "internal", "between_rafters", "external"
+
+    λ and the between-rafters flag are resolved once at construction;
+    an unknown material fails here rather than on every calculation.
     """
     thickness_m: float
     material: str
     position: str
 
+    lam: float = field(init=False, repr=False, compare=False)
+    is_between_rafters: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        lam = LAMBDA.get(self.material)
+        if lam is None:
+            raise ValueError(f"Material '{self.material}' has no lambda assigned.")
+        object.__setattr__(self, "lam", lam)
+        object.__setattr__(
+            self, "is_between_rafters", self.position == "between_rafters"
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PitchedRoof:
     """
     Full roof definition for U-value + thermal response calculation.
+
+    Frozen: layers are stored as a tuple and the bridging fraction is
+    resolved once at construction. Use copy(**overrides) to derive a
+    modified roof.
     """
     pitch_deg: float
-    layers: List[RoofLayer]
+    layers: Tuple[RoofLayer, ...]
     ventilated: bool
     bridging: str
     thermal_mass: str
     mode: str     # "CIBSE", "SAP", "COMFORT"
     target_u: Optional[float] = None   # used in "TARGET" mode
 
+    _f_bridge: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "layers", tuple(self.layers))
+        object.__setattr__(self, "_f_bridge", BRIDGING.get(self.bridging, 0.10))
+
+    def copy(self, **overrides: Any) -> "PitchedRoof":
+        """New roof with the given fields replaced (re-derived)."""
+        return replace(self, **overrides)
+
+    def to_arrays(
+        self,
+    ) -> Tuple[Tuple[float, ...], Tuple[float, ...], Tuple[bool, ...]]:
+        """
+        Structure-of-arrays view of the layers:
+            (thickness_m, lambda, is_between_rafters)
+        """
+        thk = tuple(layer.thickness_m for layer in self.layers)
+        lam = tuple(layer.lam for layer in self.layers)
+        mask = tuple(layer.is_between_rafters for layer in self.layers)
+        return thk, lam, mask
+
+
+@dataclass(frozen=True, slots=True)
+class PitchedRoofBatch:
+    """
+    Many roofs packed as structure-of-arrays (U-value batch path).
+
+    Per roof (N):  pitch_deg, ventilated, bridge_f
+    Per layer (T): layer_thk, layer_lam, layer_is_btw  — all roofs'
+                   layers concatenated, CSR style
+    offsets (N+1): layers of roof i are offsets[i]:offsets[i + 1]
+    """
+    pitch_deg: Tuple[float, ...]
+    ventilated: Tuple[bool, ...]
+    bridge_f: Tuple[float, ...]
+    layer_thk: Tuple[float, ...]
+    layer_lam: Tuple[float, ...]
+    layer_is_btw: Tuple[bool, ...]
+    offsets: Tuple[int, ...]
+
+    @classmethod
+    def from_roofs(cls, roofs: Sequence[PitchedRoof]) -> "PitchedRoofBatch":
+        thk: List[float] = []
+        lam: List[float] = []
+        btw: List[bool] = []
+        offsets: List[int] = [0]
+
+        for roof in roofs:
+            for layer in roof.layers:
+                thk.append(layer.thickness_m)
+                lam.append(layer.lam)
+                btw.append(layer.is_between_rafters)
+            offsets.append(len(thk))
+
+        return cls(
+            pitch_deg=tuple(roof.pitch_deg for roof in roofs),
+            ventilated=tuple(roof.ventilated for roof in roofs),
+            bridge_f=tuple(roof._f_bridge for roof in roofs),
+            layer_thk=tuple(thk),
+            layer_lam=tuple(lam),
+            layer_is_btw=tuple(btw),
+            offsets=tuple(offsets),
+        )
+
+    def __len__(self) -> int:
+        return len(self.pitch_deg)
+
+
+class RoofPerformanceResult(NamedTuple):
+    """
+    Result of compute_roof_performance().
+
+    Field names match the legacy dict keys; use as_dict() where a
+    dict is still expected.
+    """
+    U_value: float
+    Comfort_adjusted_U: float
+    Pitch_deg: float
+    Ventilated: bool
+    Bridging: str
+    Thermal_mass: str
+
+    def as_dict(self) -> Dict[str, object]:
+        return dict(self._asdict())
+
 
 # ---------------------------------------------------------------------------
 # INTERNAL HELPERS
@@ -112,32 +237,33 @@ class PitchedRoof:
 def interpolate_pitch_factor(pitch_deg: float) -> float:
     """
     Interpolate Rse correction factor based on pitch.
+
+    O(1): the segment is indexed directly (no search over breakpoints).
     """
-    keys = sorted(PITCH_RSE_FACTOR.keys())
-    if pitch_deg <= keys[0]:
-        return PITCH_RSE_FACTOR[keys[0]]
-    if pitch_deg >= keys[-1]:
-        return PITCH_RSE_FACTOR[keys[-1]]
+    if pitch_deg <= _PITCH_MIN:
+        return _PITCH_FACTOR_MIN
+    if pitch_deg >= _PITCH_MAX:
+        return _PITCH_FACTOR_MAX
+    if pitch_deg != pitch_deg:
+        return 1.15  # fallback (NaN pitch)
+
+    a, fa, rise = _PITCH_SEGMENTS[int((pitch_deg - _PITCH_MIN) // _PITCH_STEP)]
+    t = (pitch_deg - a) / _PITCH_STEP
+    return fa + t * rise
 
-    for i in range(len(keys) - 1):
-        a, b = keys[i], keys[i + 1]
-        if a <= pitch_deg <= b:
-            fa = PITCH_RSE_FACTOR[a]
-            fb = PITCH_RSE_FACTOR[b]
-            t = (pitch_deg - a) / (b - a)
-            return fa + t * (fb - fa)
 
-    return 1.15  # fallback
+def interpolate_pitch_factor_array(pitch_degs: Sequence[float]) -> List[float]:
+    """
+    Rse correction factors for many pitches (orientation / pitch sweeps).
+    """
+    return [interpolate_pitch_factor(p) for p in pitch_degs]
 
 
 def layer_resistance(layer: RoofLayer) -> float:
     """
     Returns thermal resistance of a layer.
     """
-    lam = LAMBDA.get(layer.material)
-    if lam is None:
-        raise ValueError(f"Material '{layer.material}' has no lambda assigned.")
-    return layer.thickness_m / lam
+    return layer.thickness_m / layer.lam
 
 
 # ---------------------------------------------------------------------------
@@ -156,23 +282,22 @@ def roof_u_value(roof: PitchedRoof) -> float:
     Rsi = Rsi_FLAT   # internal surface recommended value
     Rse = Rse_FLAT * interpolate_pitch_factor(roof.pitch_deg)
 
-    # Accumulate resistances
+    # Accumulate resistances (single pass; λ / flag resolved per layer
+    # at construction). to_arrays() is for the batch path only.
+    lam_rafters = _LAM_RAFTERS
+
     R_ins = 0.0
     R_raf = 0.0
 
     for layer in roof.layers:
-        R = layer_resistance(layer)
-        if layer.position == "between_rafters":
-            R_ins += R
-            # rafters have lower R (higher λ)
-            R_raf += layer.thickness_m / LAMBDA["rafters"]
-        else:
-            # non-rafter layers apply equally
-            R_ins += R
-            R_raf += R
+        t = layer.thickness_m
+        R = t / layer.lam
+        R_ins += R
+        # rafters have lower R (higher λ); other layers apply equally
+        R_raf += t / lam_rafters if layer.is_between_rafters else R
 
-    # Bridging fraction
-    f = BRIDGING.get(roof.bridging, 0.10)
+    # Bridging fraction (resolved at construction)
+    f = roof._f_bridge
 
     # Composite insulated + bridged path
     R_composite = (1 - f) * R_ins + f * R_raf
@@ -187,6 +312,47 @@ def roof_u_value(roof: PitchedRoof) -> float:
     return 1.0 / R_total
 
 
+def roof_u_value_batch(roofs: Sequence[PitchedRoof]) -> List[float]:
+    """
+    U-values for many roofs (wizard sweeps, GUI parameter scans).
+    """
+    return roof_u_value_packed(PitchedRoofBatch.from_roofs(roofs))
+
+
+def roof_u_value_packed(batch: PitchedRoofBatch) -> List[float]:
+    """
+    U-values for a packed PitchedRoofBatch.
+
+    Same arithmetic (and order) as roof_u_value(), in one pass over
+    the concatenated layer arrays.
+    """
+    thk, lam, btw = batch.layer_thk, batch.layer_lam, batch.layer_is_btw
+    offsets = batch.offsets
+    lam_rafters = _LAM_RAFTERS
+
+    out: List[float] = []
+    for i, (pitch, ventilated, f) in enumerate(
+        zip(batch.pitch_deg, batch.ventilated, batch.bridge_f)
+    ):
+        Rse = Rse_FLAT * interpolate_pitch_factor(pitch)
+
+        R_ins = 0.0
+        R_raf = 0.0
+        for j in range(offsets[i], offsets[i + 1]):
+            t = thk[j]
+            R = t / lam[j]
+            R_ins += R
+            R_raf += t / lam_rafters if btw[j] else R
+
+        R_composite = (1 - f) * R_ins + f * R_raf
+        if ventilated:
+            R_composite += R_VENTILATED_CAVITY
+
+        out.append(1.0 / (Rsi_FLAT + R_composite + Rse))
+
+    return out
+
+
 # ---------------------------------------------------------------------------
 # COMFORT MODE (thermal lag)
 # ---------------------------------------------------------------------------
@@ -205,7 +371,7 @@ def comfort_adjusted_u(roof: PitchedRoof, U: float) -> float:
 # PUBLIC API
 # ---------------------------------------------------------------------------
 
-def compute_roof_performance(roof: PitchedRoof) -> Dict[str, float]:
+def compute_roof_performance(roof: PitchedRoof) -> RoofPerformanceResult:
     """
     Main entry point for U-value and comfort-mode performance.
     """
@@ -216,14 +382,14 @@ def compute_roof_performance(roof: PitchedRoof) -> Dict[str, float]:
     else:
         U_adj = U
 
-    return {
-        "U_value": U,
-        "Comfort_adjusted_U": U_adj,
-        "Pitch_deg": roof.pitch_deg,
-        "Ventilated": roof.ventilated,
-        "Bridging": roof.bridging,
-        "Thermal_mass": roof.thermal_mass,
-    }
+    return RoofPerformanceResult(
+        U_value=U,
+        Comfort_adjusted_U=U_adj,
+        Pitch_deg=roof.pitch_deg,
+        Ventilated=roof.ventilated,
+        Bridging=roof.bridging,
+        Thermal_mass=roof.thermal_mass,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -248,5 +414,5 @@ if __name__ == "__main__":
 
     print("=== Pitched Roof Calculator — Self Test ===")
     results = compute_roof_performance(roof)
-    for k, v in results.items():
+    for k, v in results.as_dict().items():
         print(f"{k}: {v}")
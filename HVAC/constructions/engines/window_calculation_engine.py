@@ -33,10 +33,12 @@ This is a CORE physics engine and must remain GPL / immutable.
 # ================================================================
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from enum import Enum, auto
-from math import sqrt
-from typing import List, Optional, Dict
+from math import isfinite, sqrt
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
 # END IMPORTS
 # ================================================================
 
@@ -50,22 +52,19 @@ DEFAULT_R_SI_M2K_W = 0.13  # internal surface resistance
 
 # Reasonable default conductivities (W/m·K) at ~10–20 °C
 DEFAULT_GLASS_LAMBDA_W_MK = 1.0  # float glass, order-of-magnitude
-GAS_CONDUCTIVITIES_W_MK: Dict["GasType", float] = {}
+GAS_CONDUCTIVITIES_W_MK: Mapping["GasType", float] = MappingProxyType({})
 
 # Simple Low-E / gas correction factors for Ug (multipliers).
 # These are deliberately coarse; the structure is EN 673–ready.
 LOW_E_UG_FACTOR = 0.90     # ~10 % Ug improvement per low-E layer (soft coat)
 SOLAR_CONTROL_UG_FACTOR = 0.98  # Ug almost unchanged; mostly affects g-value
 
-GAS_UG_FACTORS = {
-    "AIR": 1.00,
-    "ARGON": 0.85,
-    "KRYPTON": 0.70,
-    "XENON": 0.60,
-}
+GAS_UG_FACTORS: Mapping["GasType", float] = MappingProxyType({})
 
-# Populate gas conductivity lookup once the enum is defined
-# (we reassign in _initialise_gas_conductivities()).
+# Populate gas conductivity / Ug factor lookups once the enum is defined
+# (we reassign in _initialise_gas_conductivities() and
+# _initialise_gas_ug_factors()). Both are read-only mapping proxies
+# keyed by every GasType member, so lookups index directly.
 # END CONSTANTS
 # ================================================================
 
@@ -96,7 +95,7 @@ class GasType(Enum):
 # ================================================================
 # BEGIN DATA STRUCTURES
 # ================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GlassLayer:
     """
     Single pane of glass within an IGU.
@@ -117,7 +116,7 @@ class GlassLayer:
     coating_ug_factor: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Cavity:
     """
     Gas cavity between glass panes.
@@ -134,7 +133,7 @@ class Cavity:
     custom_conductivity_W_mK: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FrameProperties:
     """
     Frame thermal properties.
@@ -149,7 +148,7 @@ class FrameProperties:
     frame_fraction: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpacerProperties:
     """
     Spacer / edge seal properties.
@@ -160,16 +159,16 @@ class SpacerProperties:
     psi_W_mK: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowConstruction:
     """
     Complete window construction description for the engine.
 
     glass_layers
-        Ordered list of glass layers from outside → inside.
+        Ordered glass layers from outside → inside (stored as a tuple).
     cavities
-        Ordered list of cavities; length must be len(glass_layers) - 1
-        for a fully specified IGU in modern mode.
+        Ordered cavities (stored as a tuple); length must be
+        len(glass_layers) - 1 for a fully specified IGU in modern mode.
     frame
         Frame properties (Uf and frame fraction).
     spacer
@@ -178,16 +177,60 @@ class WindowConstruction:
         Force legacy single-pane mode when True (if compatible).
     name
         Human-friendly identifier for presets, schedules, etc.
+
+    Frozen (safe to share, e.g. cached presets): Ug correction factors
+    and the legacy/modern Ug path are resolved once in __post_init__.
+    Use copy(**overrides) to derive a modified construction.
     """
     name: str
-    glass_layers: List[GlassLayer]
-    cavities: List[Cavity]
+    glass_layers: Tuple[GlassLayer, ...]
+    cavities: Tuple[Cavity, ...]
     frame: FrameProperties
     spacer: SpacerProperties
     use_legacy: bool = False
 
+    # Derived (not part of the public constructor)
+    _coating_factor: float = field(init=False, repr=False, compare=False)
+    _gas_factor: float = field(init=False, repr=False, compare=False)
+    _ug_fn: Callable[..., float] = field(init=False, repr=False, compare=False)
+    _r_cond: Optional[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "glass_layers", tuple(self.glass_layers))
+        object.__setattr__(self, "cavities", tuple(self.cavities))
+
+        coating_factor = 1.0
+        for layer in self.glass_layers:
+            coating_factor *= _coating_factor_for_layer(layer)
+        object.__setattr__(self, "_coating_factor", coating_factor)
+
+        # Use the "worst" cavity (highest performance gas) as the main
+        # factor. This is intentionally simplistic; no cavities ⇒ 1.0.
+        gas_factor = 1.0
+        for cavity in self.cavities:
+            gas_factor = min(gas_factor, GAS_UG_FACTORS[cavity.gas])
+        object.__setattr__(self, "_gas_factor", gas_factor)
+
+        # Legacy / modern Ug path is fixed per construction: resolve once.
+        # No glass layers ⇒ modern, which reports the missing layer.
+        if self.glass_layers and _should_use_legacy(self):
+            ug_fn = _compute_legacy_ug
+        else:
+            ug_fn = _compute_modern_ug
+        object.__setattr__(self, "_ug_fn", ug_fn)
+
+        object.__setattr__(
+            self,
+            "_r_cond",
+            _conduction_resistance(self.glass_layers, self.cavities),
+        )
+
+    def copy(self, **overrides: Any) -> "WindowConstruction":
+        """New construction with the given fields replaced (re-derived)."""
+        return replace(self, **overrides)
+
 
-@dataclass
+@dataclass(slots=True)
 class WindowCalculationResult:
     """
     Result payload returned by the engine.
@@ -215,23 +258,39 @@ def _initialise_gas_conductivities() -> None:
     """Initialise the gas conductivity lookup using the GasType enum."""
     global GAS_CONDUCTIVITIES_W_MK
 
-    GAS_CONDUCTIVITIES_W_MK = {
+    GAS_CONDUCTIVITIES_W_MK = MappingProxyType({
         GasType.AIR: 0.025,     # W/m·K (order of magnitude)
         GasType.ARGON: 0.016,
         GasType.KRYPTON: 0.009,
         GasType.XENON: 0.006,
         GasType.CUSTOM: 0.020,  # fallback if custom λ is not supplied
-    }
+    })
 
 
 _initialise_gas_conductivities()
 
 
+def _initialise_gas_ug_factors() -> None:
+    """Initialise the gas Ug factor lookup, keyed by GasType (no .name)."""
+    global GAS_UG_FACTORS
+
+    GAS_UG_FACTORS = MappingProxyType({
+        GasType.AIR: 1.00,
+        GasType.ARGON: 0.85,
+        GasType.KRYPTON: 0.70,
+        GasType.XENON: 0.60,
+        GasType.CUSTOM: 1.00,  # no generic correction for custom fills
+    })
+
+
+_initialise_gas_ug_factors()
+
+
 def _gas_lambda(cavity: Cavity) -> float:
     """Return gas conductivity λ (W/m·K) for a cavity."""
     if cavity.gas is GasType.CUSTOM and cavity.custom_conductivity_W_mK is not None:
         return cavity.custom_conductivity_W_mK
-    return GAS_CONDUCTIVITIES_W_MK.get(cavity.gas, GAS_CONDUCTIVITIES_W_MK[GasType.AIR])
+    return GAS_CONDUCTIVITIES_W_MK[cavity.gas]
 
 
 def _should_use_legacy(construction: WindowConstruction) -> bool:
@@ -291,6 +350,33 @@ def _coating_factor_for_layer(layer: GlassLayer) -> float:
     return 1.0
 
 
+def _conduction_resistance(glass_layers: Sequence[GlassLayer],
+                           cavities: Sequence[Cavity]) -> Optional[float]:
+    """
+    Conduction resistance of the glass + gas stack (m²K/W):
+
+        R_cond = Σ (t_glass / λ_glass) + Σ (t_gas / λ_gas)
+
+    Invariant per construction; computed once in __post_init__.
+    Returns None if any λ is not positive — _compute_modern_ug
+    reports which one, so construction itself never fails here.
+    """
+    R_glass = 0.0
+    for layer in glass_layers:
+        if layer.conductivity_W_mK <= 0.0:
+            return None
+        R_glass += layer.thickness_m / layer.conductivity_W_mK
+
+    R_gas = 0.0
+    for cavity in cavities:
+        lam = _gas_lambda(cavity)
+        if lam <= 0.0:
+            return None
+        R_gas += cavity.width_m / lam
+
+    return R_glass + R_gas
+
+
 def _compute_modern_ug(construction: WindowConstruction,
                        R_se: float = DEFAULT_R_SE_M2K_W,
                        R_si: float = DEFAULT_R_SI_M2K_W) -> float:
@@ -310,40 +396,36 @@ def _compute_modern_ug(construction: WindowConstruction,
     if not construction.glass_layers:
         raise ValueError("At least one glass layer is required for modern mode.")
 
-    # 1) Conduction through glass layers
-    R_glass = 0.0
-    for layer in construction.glass_layers:
-        if layer.conductivity_W_mK <= 0.0:
-            raise ValueError("Glass conductivity must be positive.")
-        R_glass += layer.thickness_m / layer.conductivity_W_mK
+    R_cond = construction._r_cond
+    if R_cond is None:
+        for layer in construction.glass_layers:
+            if layer.conductivity_W_mK <= 0.0:
+                raise ValueError("Glass conductivity must be positive.")
+        raise ValueError("Gas conductivity must be positive.")
+
+    return _ug_kernel(
+        R_cond,
+        construction._coating_factor,
+        construction._gas_factor,
+        R_se,
+        R_si,
+    )
 
-    # 2) Conduction through gas cavities
-    R_gas = 0.0
-    for cavity in construction.cavities:
-        lam = _gas_lambda(cavity)
-        if lam <= 0.0:
-            raise ValueError("Gas conductivity must be positive.")
-        R_gas += cavity.width_m / lam
 
-    R_cond = R_glass + R_gas
+def _ug_kernel(R_cond: float,
+               coating_factor: float,
+               gas_factor: float,
+               R_se: float,
+               R_si: float) -> float:
+    """
+    Numeric core of the modern Ug path (floats only, no validation).
+
+        U = coating_factor * gas_factor / (R_se + R_cond + R_si)
+    """
     R_total = R_se + R_cond + R_si
     U_base = 1.0 / R_total
 
-    # 3) Apply simple coating & gas correction factors
-    coating_factor = 1.0
-    for layer in construction.glass_layers:
-        coating_factor *= _coating_factor_for_layer(layer)
-
-    gas_factor = 1.0
-    if construction.cavities:
-        # Use the "worst" cavity (highest performance gas) as the main factor.
-        # This is intentionally simplistic.
-        best_factor = 1.0
-        for cavity in construction.cavities:
-            name = cavity.gas.name
-            best_factor = min(best_factor, GAS_UG_FACTORS.get(name, 1.0))
-        gas_factor = best_factor
-
+    # Apply per-construction coating & gas correction factors
     return U_base * coating_factor * gas_factor
 
 
@@ -357,75 +439,68 @@ def _approximate_glass_edge_length(Ag: float) -> float:
 
     This is a pragmatic default when we don't know actual edge length.
     """
-    if Ag <= 0.0:
-        return 0.0
-    side = sqrt(Ag)
-    return 4.0 * side
-# END INTERNAL HELPERS
-# ================================================================
+    return 0.0 if Ag <= 0.0 else 4.0 * sqrt(Ag)
 
 
-# ================================================================
-# BEGIN PUBLIC API
-# ================================================================
-def compute_window_performance(
-        construction: WindowConstruction,
-        width_m: float,
-        height_m: float,
-        *,
-        glass_edge_length_m: Optional[float] = None,
-        override_ug_W_m2K: Optional[float] = None,
-        override_uf_W_m2K: Optional[float] = None,
-        override_psi_W_mK: Optional[float] = None,
-        R_se: float = DEFAULT_R_SE_M2K_W,
-        R_si: float = DEFAULT_R_SI_M2K_W,
-) -> WindowCalculationResult:
+def _approximate_glass_edge_length_vec(Ag: Sequence[float]) -> List[float]:
     """
-    Main entry-point: compute window U-values and fractions.
+    _approximate_glass_edge_length() over many glass areas (batch path).
+    """
+    return [0.0 if a <= 0.0 else 4.0 * sqrt(a) for a in Ag]
 
-    Parameters
-    ----------
-    construction
-        WindowConstruction describing glass, frame, and spacer.
-    width_m, height_m
-        Overall window opening dimensions (m).
-    glass_edge_length_m
-        Optional explicit glass edge length L (m). If not provided,
-        it is estimated from the glass area (rough square assumption).
-    override_ug_W_m2K
-        If provided, use this Ug value instead of computed legacy/modern.
-    override_uf_W_m2K
-        If provided, use this Uf instead of construction.frame.Uf_W_m2K.
-    override_psi_W_mK
-        If provided, use this ψ instead of construction.spacer.psi_W_mK.
-    R_se, R_si
-        Surface resistances (m²K/W).
 
-    Returns
-    -------
-    WindowCalculationResult
-        Ug, Uf, ψ_edge, Uw, and area fractions.
+def _validate_window_inputs(construction: WindowConstruction,
+                            width_m: float,
+                            height_m: float) -> None:
+    """
+    Preconditions shared by the single and batch entry points.
+
+    The total area is checked on its own: positive width and height
+    can still multiply to 0.0 (underflow, e.g. 1e-200 m), and NaN / inf
+    dimensions pass the sign test. After this, Atotal is finite and > 0.
     """
     if width_m <= 0.0 or height_m <= 0.0:
         raise ValueError("Window dimensions must be positive.")
 
     Atotal = width_m * height_m
+    if not Atotal > 0.0:     # also catches NaN
+        raise ValueError("Total window area must be positive.")
+    if not isfinite(Atotal):
+        raise ValueError("Total window area must be finite.")
+
     frame_fraction = construction.frame.frame_fraction
     if not (0.0 <= frame_fraction < 1.0):
         raise ValueError("Frame fraction must be within [0, 1).")
 
+
+def _compute_window_performance_unchecked(
+        construction: WindowConstruction,
+        width_m: float,
+        height_m: float,
+        glass_edge_length_m: Optional[float],
+        override_ug_W_m2K: Optional[float],
+        override_uf_W_m2K: Optional[float],
+        override_psi_W_mK: Optional[float],
+        R_se: float,
+        R_si: float,
+) -> WindowCalculationResult:
+    """
+    Calculation core of compute_window_performance() (no validation).
+
+    Callers must have run _validate_window_inputs() first.
+    """
+    Atotal = width_m * height_m
+    frame_fraction = construction.frame.frame_fraction
+
     Af = frame_fraction * Atotal
     Ag = Atotal - Af
-    glass_fraction = Ag / Atotal if Atotal > 0.0 else 0.0
+    glass_fraction = Ag / Atotal
 
     # --- Ug ---
     if override_ug_W_m2K is not None:
         Ug = override_ug_W_m2K
     else:
-        if _should_use_legacy(construction):
-            Ug = _compute_legacy_ug(construction, R_se=R_se, R_si=R_si)
-        else:
-            Ug = _compute_modern_ug(construction, R_se=R_se, R_si=R_si)
+        Ug = construction._ug_fn(construction, R_se=R_se, R_si=R_si)
 
     # --- Uf ---
     Uf = override_uf_W_m2K if override_uf_W_m2K is not None else construction.frame.Uf_W_m2K
@@ -441,9 +516,6 @@ def compute_window_performance(
         L_edge = _approximate_glass_edge_length(Ag)
 
     # --- Uw ---
-    if Atotal <= 0.0:
-        raise ValueError("Total window area must be positive.")
-
     Uw = (Ag * Ug + Af * Uf + L_edge * psi_edge) / Atotal
 
     # Legacy note: original cabin/boat formula was:
@@ -459,6 +531,104 @@ def compute_window_performance(
         glass_fraction=glass_fraction,
         frame_fraction=frame_fraction,
     )
+# END INTERNAL HELPERS
+# ================================================================
+
+
+# ================================================================
+# BEGIN PUBLIC API
+# ================================================================
+def compute_window_performance(
+        construction: WindowConstruction,
+        width_m: float,
+        height_m: float,
+        *,
+        glass_edge_length_m: Optional[float] = None,
+        override_ug_W_m2K: Optional[float] = None,
+        override_uf_W_m2K: Optional[float] = None,
+        override_psi_W_mK: Optional[float] = None,
+        R_se: float = DEFAULT_R_SE_M2K_W,
+        R_si: float = DEFAULT_R_SI_M2K_W,
+) -> WindowCalculationResult:
+    """
+    Main entry-point: compute window U-values and fractions.
+
+    Parameters
+    ----------
+    construction
+        WindowConstruction describing glass, frame, and spacer.
+    width_m, height_m
+        Overall window opening dimensions (m).
+    glass_edge_length_m
+        Optional explicit glass edge length L (m). If not provided,
+        it is estimated from the glass area (rough square assumption).
+    override_ug_W_m2K
+        If provided, use this Ug value instead of computed legacy/modern.
+    override_uf_W_m2K
+        If provided, use this Uf instead of construction.frame.Uf_W_m2K.
+    override_psi_W_mK
+        If provided, use this ψ instead of construction.spacer.psi_W_mK.
+    R_se, R_si
+        Surface resistances (m²K/W).
+
+    Returns
+    -------
+    WindowCalculationResult
+        Ug, Uf, ψ_edge, Uw, and area fractions.
+    """
+    _validate_window_inputs(construction, width_m, height_m)
+
+    return _compute_window_performance_unchecked(
+        construction,
+        width_m,
+        height_m,
+        glass_edge_length_m,
+        override_ug_W_m2K,
+        override_uf_W_m2K,
+        override_psi_W_mK,
+        R_se,
+        R_si,
+    )
+
+
+def compute_window_performance_batch(
+        constructions: Sequence[WindowConstruction],
+        widths_m: Sequence[float],
+        heights_m: Sequence[float],
+        *,
+        R_se: float = DEFAULT_R_SE_M2K_W,
+        R_si: float = DEFAULT_R_SI_M2K_W,
+) -> List[float]:
+    """
+    Overall Uw for many windows (building schedules, sweeps).
+
+    Equivalent to compute_window_performance(c, w, h).Uw_W_m2K per item,
+    with the estimated edge length; no result objects are built.
+    All inputs are validated up front, before any calculation.
+
+        Uw = (Ag·Ug + Af·Uf + 4·sqrt(Ag)·ψ) / Atotal
+    """
+    n = len(constructions)
+    if len(widths_m) != n or len(heights_m) != n:
+        raise ValueError("constructions, widths_m and heights_m must be equal length.")
+
+    for construction, width_m, height_m in zip(constructions, widths_m, heights_m):
+        _validate_window_inputs(construction, width_m, height_m)
+
+    Atotal = [w * h for w, h in zip(widths_m, heights_m)]
+    Af = [c.frame.frame_fraction * a for c, a in zip(constructions, Atotal)]
+    Ag = [a - a_f for a, a_f in zip(Atotal, Af)]
+    L_edge = _approximate_glass_edge_length_vec(Ag)
+
+    Uw: List[float] = []
+    for construction, a_total, a_f, a_g, l_edge in zip(
+            constructions, Atotal, Af, Ag, L_edge):
+        Ug = construction._ug_fn(construction, R_se=R_se, R_si=R_si)
+        Uw.append(
+            (a_g * Ug + a_f * construction.frame.Uf_W_m2K
+             + l_edge * construction.spacer.psi_W_mK) / a_total
+        )
+    return Uw
 # END PUBLIC API
 # ================================================================
 
@@ -466,6 +636,9 @@ def compute_window_performance(
 # ================================================================
 # BEGIN PRESETS
 # ================================================================
+# Presets return frozen, shared instances (cached per argument set);
+# derive variants with WindowConstruction.copy(**overrides).
+@lru_cache(maxsize=64)
 def preset_legacy_single_pane_cabin(
         name: str = "Legacy single-pane cabin",
         pane_thickness_m: float = 0.005,  # 5 mm toughened
@@ -488,14 +661,15 @@ def preset_legacy_single_pane_cabin(
     spacer = SpacerProperties(psi_W_mK=0.0)
     return WindowConstruction(
         name=name,
-        glass_layers=[glass],
-        cavities=[],
+        glass_layers=(glass,),
+        cavities=(),
         frame=frame,
         spacer=spacer,
         use_legacy=True,
     )
 
 
+@lru_cache(maxsize=64)
 def preset_scandi_triple_low_e_argon(
         name: str = "Scandinavian triple, Low-E, Argon",
         pane_thickness_m: float = 0.004,
@@ -559,6 +733,7 @@ __all__ = [
     "WindowConstruction",
     "WindowCalculationResult",
     "compute_window_performance",
+    "compute_window_performance_batch",
     "preset_legacy_single_pane_cabin",
     "preset_scandi_triple_low_e_argon",
 ]
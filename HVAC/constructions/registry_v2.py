@@ -19,7 +19,9 @@ RULES (LOCKED)
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NoReturn, Tuple
 
 from HVAC.constructions.construction_preset import ConstructionPreset, SurfaceClass
 from HVAC.constructions.construction_preset_registry import ConstructionPresetRegistry
@@ -29,9 +31,7 @@ from HVAC.constructions.dto.construction_uvalue_result_dto import (
     ConstructionUValueResultDTO,
 )
 
-from HVAC.constructions.engines.pitched_roof_calculator import PitchedRoof, RoofLayer
-from HVAC.constructions.engines.window_calculation_engine import WindowConstruction
-
+from .adapters._dto_pool import intern_uvalue_dto
 from .adapters.roof_to_uvalue_dto import build_pitched_roof_uvalue_dto
 from .adapters.flat_roof_to_uvalue_dto import build_flat_roof_uvalue_dto
 from .adapters.external_wall_to_uvalue_dto import build_external_wall_brick_stud_uvalue_dto
@@ -39,6 +39,41 @@ from .adapters.floor_to_uvalue_dto import build_floor_uvalue_dto
 from .adapters.window_to_uvalue_dto import build_window_uvalue_dto
 
 
+# Bound on memoised preset resolutions (a project uses a small working set)
+DEFAULT_UV_CACHE_SIZE = 4096
+
+
+# ----------------------------------------------------------------------
+# Error helpers (cold path)
+# ----------------------------------------------------------------------
+# Message building lives out of line so the resolve path stays a
+# compare + call; these only run when a check has already failed.
+
+def _raise_surface_type(surface_class: Any) -> NoReturn:
+    raise TypeError(
+        f"surface_class must be SurfaceClass, got {type(surface_class)}"
+    )
+
+
+def _raise_preset_mismatch(
+    preset: ConstructionPreset, surface_class: SurfaceClass
+) -> NoReturn:
+    raise ValueError(
+        "Preset surface mismatch:\n"
+        f"  preset_ref     : {preset.ref}\n"
+        f"  preset.surface : {preset.surface_class!r}\n"
+        f"  requested      : {surface_class!r}"
+    )
+
+
+def _raise_invalid_u(preset: ConstructionPreset) -> NoReturn:
+    raise ValueError(
+        "Invalid preset U-value:\n"
+        f"  preset_ref : {preset.ref}\n"
+        f"  u_value    : {preset.u_value}"
+    )
+
+
 class ConstructionRegistryV2:
     """
     Canonical construction registry.
@@ -49,16 +84,68 @@ class ConstructionRegistryV2:
     • build engine/adapters-based constructions and return the SAME DTO
     """
 
-    def __init__(self, presets: List[ConstructionPreset]) -> None:
+    def __init__(
+        self,
+        presets: Iterable[ConstructionPreset],
+        max_cache_size: int = DEFAULT_UV_CACHE_SIZE,
+    ) -> None:
         self._presets = ConstructionPresetRegistry(presets)
 
+        # (surface_class, preset_ref) → resolved DTO, least recently used
+        # first. Presets are immutable, so a resolved result never goes
+        # stale; the cap only bounds memory.
+        self._uv_cache: OrderedDict[
+            Tuple[SurfaceClass, str], ConstructionUValueResultDTO
+        ] = OrderedDict()
+        self._max_cache_size = 0
+        self.set_cache_size(max_cache_size)
+
+        # construction_type → builder, built once
+        self._builders: Dict[
+            str, Callable[[str, Dict[str, Any]], ConstructionUValueResultDTO]
+        ] = {
+            "roof.pitched": self._build_pitched_roof,
+            "roof.flat": self._build_flat_roof,
+            "wall.external.brick_stud": self._build_external_wall_brick_stud,
+            "floor": self._build_floor,
+            "window": self._build_window,
+        }
+
+    # ------------------------------------------------------------------
+    # Result cache control
+    # ------------------------------------------------------------------
+
+    def set_cache_size(self, n: int) -> None:
+        """Cap memoised results at n entries (0 disables caching)."""
+        if n < 0:
+            raise ValueError(f"Cache size must be >= 0, got {n}")
+
+        self._max_cache_size = n
+        while len(self._uv_cache) > n:
+            self._uv_cache.popitem(last=False)
+
+    def disable_cache(self) -> None:
+        self.set_cache_size(0)
+
+    def clear_cache(self) -> None:
+        """Drop memoised build_uvalue_result() results."""
+        self._uv_cache.clear()
+
     # ------------------------------------------------------------------
     # Discovery API (read-only) — GUI uses this
     # ------------------------------------------------------------------
 
-    def list_presets_for_surface(self, surface_class: SurfaceClass) -> List[ConstructionPreset]:
+    def list_presets_for_surface(self, surface_class: SurfaceClass) -> Tuple[ConstructionPreset, ...]:
         return self._presets.list_for_surface(surface_class)
 
+    def u_values_for_surface(self, surface_class: SurfaceClass) -> array:
+        return self._presets.u_values_for_surface(surface_class)
+
+    def list_presets_for_surfaces(
+        self, surface_classes: Iterable[SurfaceClass]
+    ) -> Tuple[ConstructionPreset, ...]:
+        return self._presets.list_for_surfaces(surface_classes)
+
     # ------------------------------------------------------------------
     # Preset resolution API (CANONICAL for GUI preset pickers)
     # ------------------------------------------------------------------
@@ -69,36 +156,65 @@ class ConstructionRegistryV2:
 
         HARD RULE:
         • registry returns ConstructionUValueResultDTO(surface_class, construction_ref, u_value)
-        """
-        preset = self._presets.get(preset_ref)
 
+        Results are memoised per (surface_class, preset_ref) in a bounded
+        LRU; a hit returns the same frozen DTO without re-validating.
+        """
         # Guard: surface_class must be a SurfaceClass enum
         if not isinstance(surface_class, SurfaceClass):
-            raise TypeError(
-                f"surface_class must be SurfaceClass, got {type(surface_class)}"
-            )
+            _raise_surface_type(surface_class)
+
+        return self._build_fast(surface_class, preset_ref)
+
+    def build_many(
+        self, pairs: Iterable[Tuple[SurfaceClass, str]]
+    ) -> List[ConstructionUValueResultDTO]:
+        """
+        Resolve many (surface_class, preset_ref) pairs, in order.
+
+        Surface types are checked once for the whole batch before any
+        resolution; each pair then goes through the memoised path.
+        """
+        pairs = list(pairs)
+
+        for surface_class, _ in pairs:
+            if not isinstance(surface_class, SurfaceClass):
+                _raise_surface_type(surface_class)
+
+        build = self._build_fast
+        return [build(sc, ref) for sc, ref in pairs]
+
+    def _build_fast(self, surface_class: SurfaceClass, preset_ref: str) -> ConstructionUValueResultDTO:
+        """
+        build_uvalue_result() without the SurfaceClass type check.
+
+        Trusted internal callers only (surface_class already validated).
+        """
+        key = (surface_class, preset_ref)
+        cached = self._uv_cache.get(key)
+        if cached is not None:
+            self._uv_cache.move_to_end(key)
+            return cached
+
+        preset = self._presets.get(preset_ref)
 
         # Enum-safe comparison (SurfaceClass inherits from str)
         if preset.surface_class != surface_class:
-            raise ValueError(
-                "Preset surface mismatch:\n"
-                f"  preset_ref     : {preset.ref}\n"
-                f"  preset.surface : {preset.surface_class!r}\n"
-                f"  requested      : {surface_class!r}"
-            )
+            _raise_preset_mismatch(preset, surface_class)
 
-        if preset.u_value is None or preset.u_value <= 0.0:
-            raise ValueError(
-                "Invalid preset U-value:\n"
-                f"  preset_ref : {preset.ref}\n"
-                f"  u_value    : {preset.u_value}"
-            )
+        if not preset._valid_u:
+            _raise_invalid_u(preset)
 
-        return ConstructionUValueResultDTO(
+        dto = intern_uvalue_dto(
             surface_class=surface_class,
             construction_ref=preset.ref,
             u_value=float(preset.u_value),
         )
+        if self._max_cache_size:
+            self._uv_cache[key] = dto
+            if len(self._uv_cache) > self._max_cache_size:
+                self._uv_cache.popitem(last=False)
+        return dto
 
     # ------------------------------------------------------------------
     # Engine/adapters build API (optional in v2; still supported)
@@ -117,28 +233,23 @@ class ConstructionRegistryV2:
         This path exists for non-trivial constructions (roof/window engines).
         GUI preset pickers should prefer build_uvalue_result().
         """
-        if construction_type == "roof.pitched":
-            return self._build_pitched_roof(preset_ref, parameters)
-
-        if construction_type == "roof.flat":
-            return self._build_flat_roof(preset_ref, parameters)
+        builder = self._builders.get(construction_type)
+        if builder is None:
+            raise ValueError(f"Unsupported construction type: {construction_type}")
 
-        if construction_type == "wall.external.brick_stud":
-            return self._build_external_wall_brick_stud(preset_ref, parameters)
-
-        if construction_type == "floor":
-            return self._build_floor(preset_ref, parameters)
-
-        if construction_type == "window":
-            return self._build_window(preset_ref, parameters)
-
-        raise ValueError(f"Unsupported construction type: {construction_type}")
+        return builder(preset_ref, parameters)
 
     # ------------------------------------------------------------------
     # Internal builders
     # ------------------------------------------------------------------
 
     def _build_pitched_roof(self, preset_ref: str, parameters: Dict[str, Any]) -> ConstructionUValueResultDTO:
+        # Deferred: roof engine loads only on the pitched-roof path
+        from HVAC.constructions.engines.pitched_roof_calculator import (
+            PitchedRoof,
+            RoofLayer,
+        )
+
         preset = self._presets.get(preset_ref)
 
         layers = [RoofLayer(**layer) for layer in parameters.get("layers", [])]
@@ -188,8 +299,8 @@ class ConstructionRegistryV2:
         preset = self._presets.get(preset_ref)
 
         # If your PRESETS_V2 includes window Uw, this is the cleanest temporary path.
-        if preset.u_value and preset.u_value > 0.0:
-            return ConstructionUValueResultDTO(
+        if preset._valid_u:
+            return intern_uvalue_dto(
                 surface_class=SurfaceClass.WINDOW,
                 construction_ref=preset.ref,
                 u_value=float(preset.u_value),
@@ -210,3 +321,7 @@ class ConstructionRegistryV2:
 # ----------------------------------------------------------------------
 
 CONSTRUCTION_REGISTRY_V2 = ConstructionRegistryV2(PRESETS_V2)
+
+# Bound once: callers in loops use these without per-call attribute lookup
+GET_UVALUE = CONSTRUCTION_REGISTRY_V2.build_uvalue_result
+BUILD_UVALUES = CONSTRUCTION_REGISTRY_V2.build_many
@@ -25,7 +25,7 @@ from __future__ import annotations
 
 from typing import List
 
-from HVAC.constructions.registry_v2 import CONSTRUCTION_REGISTRY_V2
+from HVAC.constructions.registry_v2 import BUILD_UVALUES
 from HVAC.constructions.dto.construction_uvalue_result_dto import (
     ConstructionUValueResultDTO,
 )
@@ -52,29 +52,26 @@ def resolve_constructions_v1(project) -> None:
     if not presets:
         raise RuntimeError("No construction presets declared")
 
-    results: List[ConstructionUValueResultDTO] = []
-
     # ------------------------------------------------------------------
-    # Resolution loop (authoritative)
+    # Key / ref validation (whole batch, before any resolution)
     # ------------------------------------------------------------------
-    for surface_class, preset_ref in presets.items():
-
-        if not isinstance(surface_class, SurfaceClass):
-            raise TypeError(
-                f"Invalid surface class key: {surface_class}"
-            )
-
-        if not preset_ref:
-            raise RuntimeError(
-                f"No preset ref for surface class {surface_class}"
-            )
+    bad_keys = [sc for sc in presets if type(sc) is not SurfaceClass]
+    if bad_keys:
+        raise TypeError(
+            f"Invalid surface class key: {bad_keys[0]}"
+        )
 
-        dto = CONSTRUCTION_REGISTRY_V2.build_uvalue_result(
-            surface_class=surface_class,
-            preset_ref=preset_ref,
+    missing = [sc for sc, preset_ref in presets.items() if not preset_ref]
+    if missing:
+        raise RuntimeError(
+            f"No preset ref for surface class {missing[0]}"
         )
 
-        results.append(dto)
+    # ------------------------------------------------------------------
+    # Resolution (authoritative; the registry checks all surface types
+    # in one pass, then resolves each pair)
+    # ------------------------------------------------------------------
+    results: List[ConstructionUValueResultDTO] = BUILD_UVALUES(presets.items())
 
     # ------------------------------------------------------------------
     # Commit results
@@ -0,0 +1,57 @@
+# ======================================================================
+# HVAC/constructions/tests/test_construction_builder_v1.py
+# ======================================================================
+
+"""
+Construction builder regression tests.
+
+Purpose
+-------
+Pin construction_u_value() to the values of the original per-layer
+implementation (Σ t/k and Σ t/k_b, added layer by layer). Compared
+with ==, not a tolerance: reordering the sums must show up here.
+"""
+
+from __future__ import annotations
+
+from HVAC.constructions.construction_builder import (
+    Construction,
+    ConstructionLayer,
+    construction_u_value,
+    diagnostic_construction_breakdown,
+    parallel_path_resistance,
+)
+
+
+def _wall_layers() -> list:
+    return [
+        ConstructionLayer("brick", 0.102, 0.77),
+        ConstructionLayer("mineral wool", 0.14, 0.035),
+        ConstructionLayer("plasterboard", 0.0125, 0.21),
+    ]
+
+
+# ----------------------------------------------------------------------
+# Test: unbridged (no bridging fraction)
+# ----------------------------------------------------------------------
+def test_u_value_unbridged_matches_baseline() -> None:
+    con = Construction(layers=_wall_layers())
+
+    assert construction_u_value(con) == 0.2292530914432028
+    assert diagnostic_construction_breakdown(con)["U_value"] == construction_u_value(con)
+
+
+# ----------------------------------------------------------------------
+# Test: bridged (advanced mode)
+# ----------------------------------------------------------------------
+def test_u_value_bridged_matches_baseline() -> None:
+    con = Construction(
+        layers=_wall_layers(),
+        bridging_fraction=0.15,
+        bridging_conductivity=0.13,
+        mode="advanced",
+    )
+
+    assert construction_u_value(con) == 0.26672026542931176
+    assert diagnostic_construction_breakdown(con)["U_value"] == construction_u_value(con)
+    assert parallel_path_resistance(_wall_layers(), 0.15, 0.13) == 3.579246418866614
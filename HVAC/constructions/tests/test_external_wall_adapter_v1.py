@@ -0,0 +1,101 @@
+# ======================================================================
+# HVAC/constructions/tests/test_external_wall_adapter_v1.py
+# ======================================================================
+
+"""
+External wall (brick / insulated stud) adapter regression tests.
+
+Purpose
+-------
+Pin the parallel-path U-value to the original two-path formula
+
+    R_total = f_ins·(rsi + brick + ins + pb + rse)
+            + f_stud·(rsi + brick + stud + pb + rse)
+
+Compared with ==, not a tolerance, including fractions that sum to
+1.0 only within the adapter's 1e-6 tolerance.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from HVAC.constructions.adapters.external_wall_to_uvalue_dto import (
+    R_SE_WALL,
+    R_SI_WALL,
+    _Layer,
+    build_external_wall_brick_stud_uvalue_dto,
+)
+
+
+_BRICK = _Layer(conductivity_w_mk=0.77, thickness_m=0.102, r_value_m2k_w=None)
+_STUD = _Layer(conductivity_w_mk=0.13, thickness_m=0.089, r_value_m2k_w=None)
+_INSULATION = _Layer(conductivity_w_mk=0.035, thickness_m=0.089, r_value_m2k_w=None)
+_PLASTERBOARD = _Layer(conductivity_w_mk=0.21, thickness_m=0.0125, r_value_m2k_w=None)
+
+
+def _u(f_ins: float, f_stud: float, **layers) -> float:
+    kwargs = dict(
+        brick_layer=_BRICK,
+        stud_layer=_STUD,
+        insulation_layer=_INSULATION,
+        plasterboard_layer=_PLASTERBOARD,
+    )
+    kwargs.update(layers)
+    return build_external_wall_brick_stud_uvalue_dto(
+        insulation_fraction=f_ins, stud_fraction=f_stud, **kwargs
+    ).u_value
+
+
+def _original_formula(f_ins: float, f_stud: float) -> float:
+    r_brick = 0.102 / 0.77
+    r_stud = 0.089 / 0.13
+    r_ins = 0.089 / 0.035
+    r_pb = 0.0125 / 0.21
+    r_path_ins = R_SI_WALL + r_brick + r_ins + r_pb + R_SE_WALL
+    r_path_stud = R_SI_WALL + r_brick + r_stud + r_pb + R_SE_WALL
+    return 1.0 / (f_ins * r_path_ins + f_stud * r_path_stud)
+
+
+# ----------------------------------------------------------------------
+# Test: pinned U-values
+# ----------------------------------------------------------------------
+def test_u_value_matches_baseline() -> None:
+    assert _u(0.85, 0.15) == 0.37934652098311766
+    assert _u(0.8500004, 0.1499999) == 0.37934636840506003
+
+
+@pytest.mark.parametrize(
+    "f_ins, f_stud",
+    [(0.85, 0.15), (0.9, 0.1), (0.7, 0.3), (0.8500004, 0.1499999), (0.9, 0.0999995)],
+)
+def test_u_value_matches_two_path_formula(f_ins, f_stud) -> None:
+    assert _u(f_ins, f_stud) == _original_formula(f_ins, f_stud)
+
+
+# ----------------------------------------------------------------------
+# Test: missing / invalid layer data
+# ----------------------------------------------------------------------
+def test_missing_or_non_positive_layer_counts_as_zero_r() -> None:
+    no_stud = _Layer(conductivity_w_mk=None, thickness_m=0.089, r_value_m2k_w=None)
+    zero_stud = _Layer(conductivity_w_mk=0.13, thickness_m=0.0, r_value_m2k_w=None)
+
+    expected = 1.0 / (
+        0.85 * (R_SI_WALL + 0.102 / 0.77 + 0.089 / 0.035 + 0.0125 / 0.21 + R_SE_WALL)
+        + 0.15 * (R_SI_WALL + 0.102 / 0.77 + 0.0 + 0.0125 / 0.21 + R_SE_WALL)
+    )
+    assert _u(0.85, 0.15, stud_layer=no_stud) == expected
+    assert _u(0.85, 0.15, stud_layer=zero_stud) == expected
+
+
+@pytest.mark.parametrize(
+    "layer",
+    [
+        _Layer(conductivity_w_mk=0.035, thickness_m=float("nan"), r_value_m2k_w=None),
+        _Layer(conductivity_w_mk=float("nan"), thickness_m=0.089, r_value_m2k_w=None),
+    ],
+)
+def test_nan_layer_data_propagates(layer) -> None:
+    assert math.isnan(_u(0.85, 0.15, insulation_layer=layer))
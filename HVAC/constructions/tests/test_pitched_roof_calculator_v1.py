@@ -0,0 +1,52 @@
+# ======================================================================
+# HVAC/constructions/tests/test_pitched_roof_calculator_v1.py
+# ======================================================================
+
+"""
+Pitched roof batch-path tests.
+
+Purpose
+-------
+Prove that roof_u_value_batch() / roof_u_value_packed() return exactly
+roof_u_value() per roof (same arithmetic and order), across pitches,
+ventilation, bridging grades and layer counts.
+"""
+
+from __future__ import annotations
+
+from HVAC.constructions.engines.pitched_roof_calculator import (
+    PitchedRoof,
+    PitchedRoofBatch,
+    RoofLayer,
+    roof_u_value,
+    roof_u_value_batch,
+    roof_u_value_packed,
+)
+
+
+def _roofs() -> list:
+    warm = (
+        RoofLayer(0.0125, "plasterboard", "internal"),
+        RoofLayer(0.200, "rockwool", "between_rafters"),
+        RoofLayer(0.018, "osb", "external"),
+    )
+    over_rafter = warm + (RoofLayer(0.050, "pir", "external"),)
+
+    return [
+        PitchedRoof(35, warm, True, "typical", "medium", "COMFORT"),
+        PitchedRoof(0, warm, False, "good", "light", "CIBSE"),
+        PitchedRoof(52.5, over_rafter, False, "poor", "heavy", "SAP"),
+        PitchedRoof(80, over_rafter[:1], True, "unknown", "medium", "CIBSE"),
+    ]
+
+
+def test_batch_matches_scalar_u_value() -> None:
+    roofs = _roofs()
+    expected = [roof_u_value(r) for r in roofs]
+
+    assert roof_u_value_batch(roofs) == expected
+    assert roof_u_value_packed(PitchedRoofBatch.from_roofs(roofs)) == expected
+
+
+def test_empty_batch() -> None:
+    assert roof_u_value_batch([]) == []
@@ -0,0 +1,39 @@
+# ======================================================================
+# HVAC/constructions/tests/test_registry_v2_batch_v1.py
+# ======================================================================
+
+"""
+Construction registry v2 batch-path tests.
+
+Purpose
+-------
+Prove that build_many() returns build_uvalue_result() per pair, in
+order, and rejects a bad surface type before resolving anything.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from HVAC.constructions.presets_v2 import PRESETS_V2
+from HVAC.constructions.registry_v2 import ConstructionRegistryV2
+
+
+def test_build_many_matches_scalar() -> None:
+    registry = ConstructionRegistryV2(PRESETS_V2)
+    pairs = [(p.surface_class, p.ref) for p in PRESETS_V2 if p.u_value is not None]
+    pairs += pairs[:2]   # repeats take the memoised path
+
+    assert registry.build_many(pairs) == [
+        registry.build_uvalue_result(sc, ref) for sc, ref in pairs
+    ]
+
+
+def test_build_many_checks_types_before_resolving() -> None:
+    registry = ConstructionRegistryV2(PRESETS_V2)
+    first = PRESETS_V2[0]
+
+    with pytest.raises(TypeError):
+        registry.build_many([(first.surface_class, first.ref), ("roof", first.ref)])
+
+    assert not registry._uv_cache
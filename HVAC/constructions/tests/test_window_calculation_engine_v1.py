@@ -0,0 +1,62 @@
+# ======================================================================
+# HVAC/constructions/tests/test_window_calculation_engine_v1.py
+# ======================================================================
+
+"""
+Window engine batch-path tests.
+
+Purpose
+-------
+Prove that compute_window_performance_batch() returns exactly the Uw
+of compute_window_performance() per window, for legacy and modern
+constructions and a mixed schedule.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from HVAC.constructions.engines.window_calculation_engine import (
+    FrameProperties,
+    compute_window_performance,
+    compute_window_performance_batch,
+    preset_legacy_single_pane_cabin,
+    preset_scandi_triple_low_e_argon,
+)
+
+
+def test_batch_matches_scalar_uw() -> None:
+    legacy = preset_legacy_single_pane_cabin()
+    triple = preset_scandi_triple_low_e_argon()
+    wide_frame = triple.copy(
+        name="Triple, wide frame",
+        frame=FrameProperties(Uf_W_m2K=1.0, frame_fraction=0.35),
+    )
+
+    constructions = [legacy, triple, wide_frame, legacy, triple]
+    widths = [0.6, 1.2, 2.4, 0.9, 1.0]
+    heights = [0.4, 1.2, 1.5, 1.1, 2.1]
+
+    batch = compute_window_performance_batch(constructions, widths, heights)
+
+    assert batch == [
+        compute_window_performance(c, w, h).Uw_W_m2K
+        for c, w, h in zip(constructions, widths, heights)
+    ]
+
+
+@pytest.mark.parametrize(
+    "width_m, height_m",
+    [
+        (1e-200, 1e-200),               # positive, but the area underflows to 0.0
+        (float("nan"), 1.0),
+        (1.0, float("inf")),
+    ],
+)
+def test_degenerate_area_rejected(width_m, height_m) -> None:
+    triple = preset_scandi_triple_low_e_argon()
+
+    with pytest.raises(ValueError, match="Total window area"):
+        compute_window_performance(triple, width_m, height_m)
+    with pytest.raises(ValueError, match="Total window area"):
+        compute_window_performance_batch([triple], [width_m], [height_m])
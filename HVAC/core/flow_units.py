@@ -25,12 +25,23 @@ No HVAC logic lives here.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+
+# ================================================================
+# CONSTANTS
+# ================================================================
+# Conversion factors folded once so the conversions multiply, not divide
+_INV_3600 = 1.0 / 3600.0
+_L_S_PER_M3_H = 1000.0 / 3600.0
+_M3_H_PER_L_S = 3600.0 / 1000.0
+_INV_1000 = 1.0 / 1000.0
 
 
 # ================================================================
 # DATA MODEL
 # ================================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlowUnits:
     m3_h: float
     l_s: float
@@ -55,8 +66,8 @@ def flow_from_m3_h(
     if m3_h < 0:
         raise ValueError("Flow must be non-negative")
 
-    l_s = (m3_h * 1000.0) / 3600.0
-    kg_s = (m3_h / 3600.0) * density_kg_m3
+    l_s = m3_h * _L_S_PER_M3_H
+    kg_s = m3_h * _INV_3600 * density_kg_m3
 
     return FlowUnits(
         m3_h=m3_h,
@@ -73,8 +84,8 @@ def flow_from_l_s(
     if l_s < 0:
         raise ValueError("Flow must be non-negative")
 
-    m3_h = (l_s * 3600.0) / 1000.0
-    kg_s = l_s * (density_kg_m3 / 1000.0)
+    m3_h = l_s * _M3_H_PER_L_S
+    kg_s = l_s * (density_kg_m3 * _INV_1000)
 
     return FlowUnits(
         m3_h=m3_h,
@@ -91,8 +102,9 @@ def flow_from_kg_s(
     if kg_s < 0:
         raise ValueError("Flow must be non-negative")
 
-    m3_h = (kg_s / density_kg_m3) * 3600.0
-    l_s = kg_s / (density_kg_m3 / 1000.0)
+    inv_rho = 1.0 / density_kg_m3
+    m3_h = kg_s * inv_rho * 3600.0
+    l_s = kg_s * inv_rho * 1000.0
 
     return FlowUnits(
         m3_h=m3_h,
@@ -101,6 +113,63 @@ def flow_from_kg_s(
     )
 
 
+# ================================================================
+# BATCH CONVERSIONS
+# ================================================================
+# Column form (m3_h[], l_s[], kg_s[]) for per-circuit / per-terminal
+# loops: same arithmetic as the scalar functions, no FlowUnits per item.
+FlowColumns = Tuple[List[float], List[float], List[float]]
+
+
+def _check_non_negative(values: Sequence[float]) -> None:
+    if any(v < 0 for v in values):
+        raise ValueError("Flow must be non-negative")
+
+
+def flow_from_m3_h_batch(
+    m3_h: Sequence[float],
+    *,
+    density_kg_m3: float = 1000.0,
+) -> FlowColumns:
+    _check_non_negative(m3_h)
+
+    return (
+        list(m3_h),
+        [q * _L_S_PER_M3_H for q in m3_h],
+        [q * _INV_3600 * density_kg_m3 for q in m3_h],
+    )
+
+
+def flow_from_l_s_batch(
+    l_s: Sequence[float],
+    *,
+    density_kg_m3: float = 1000.0,
+) -> FlowColumns:
+    _check_non_negative(l_s)
+
+    rho_per_l = density_kg_m3 * _INV_1000
+    return (
+        [q * _M3_H_PER_L_S for q in l_s],
+        list(l_s),
+        [q * rho_per_l for q in l_s],
+    )
+
+
+def flow_from_kg_s_batch(
+    kg_s: Sequence[float],
+    *,
+    density_kg_m3: float = 1000.0,
+) -> FlowColumns:
+    _check_non_negative(kg_s)
+
+    inv_rho = 1.0 / density_kg_m3
+    return (
+        [q * inv_rho * 3600.0 for q in kg_s],
+        [q * inv_rho * 1000.0 for q in kg_s],
+        list(kg_s),
+    )
+
+
 # ================================================================
 # DISPLAY HELPERS
 # ================================================================
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import os
 import json
+from pathlib import Path
 from typing import Dict
 
 
@@ -55,6 +56,11 @@ DEFAULT_THEME = {
     "accent": "#4aa3ff",
 }
 
+# Serialised once; written verbatim on first launch
+_DEFAULT_SETTINGS_JSON = json.dumps(DEFAULT_SETTINGS, indent=2)
+_DEFAULT_THEME_JSON = json.dumps(DEFAULT_THEME, indent=2)
+_LOG_HEADER = "HVACgooee Log Start\n"
+
 
 # ---------------------------------------------------------------
 # Core Initialiser
@@ -66,31 +72,44 @@ def create_standard_structure(base_path: str) -> None:
 
     Example:
         create_standard_structure("/home/user/HVACgooee")
+
+    Only leaf directories are created (parents=True covers the rest),
+    each path once.
     """
+    base = Path(base_path)
 
-    for main_dir, sub_dirs in STANDARD_DIRS.items():
-        main_path = os.path.join(base_path, main_dir)
-        os.makedirs(main_path, exist_ok=True)
+    leaves = {
+        base / main_dir / sub
+        for main_dir, sub_dirs in STANDARD_DIRS.items()
+        for sub in (sub_dirs or [""])
+    }
 
-        for sub in sub_dirs:
-            os.makedirs(os.path.join(main_path, sub), exist_ok=True)
+    for path in sorted(leaves):
+        path.mkdir(parents=True, exist_ok=True)
 
 
-def create_default_config(config_path: str) -> None:
+def _write_if_missing(path: Path, text: str) -> None:
     """
-    Create default settings.json and themes.json if missing.
+    Create path with text unless it already exists.
+
+    Exclusive-create ("x"): one open, no exists() check, and never
+    clobbers a file created concurrently (e.g. a second first launch).
     """
+    try:
+        with path.open("x") as f:
+            f.write(text)
+    except FileExistsError:
+        pass
 
-    settings_file = os.path.join(config_path, "settings.json")
-    theme_file = os.path.join(config_path, "themes.json")
 
-    if not os.path.exists(settings_file):
-        with open(settings_file, "w") as f:
-            json.dump(DEFAULT_SETTINGS, f, indent=2)
+def create_default_config(config_path: str) -> None:
+    """
+    Create default settings.json and themes.json if missing.
+    """
+    config = Path(config_path)
 
-    if not os.path.exists(theme_file):
-        with open(theme_file, "w") as f:
-            json.dump(DEFAULT_THEME, f, indent=2)
+    _write_if_missing(config / "settings.json", _DEFAULT_SETTINGS_JSON)
+    _write_if_missing(config / "themes.json", _DEFAULT_THEME_JSON)
 
 
 # ---------------------------------------------------------------
@@ -109,14 +128,9 @@ def ensure_gooee_environment(base_path: str) -> None:
     create_default_config(config_path)
 
     # create empty log file
-    log_file = os.path.join(base_path, "logs", "gooee.log")
-    if not os.path.exists(log_file):
-        with open(log_file, "w") as f:
-            f.write("HVACgooee Log Start\n")
-
-    # create projects directory
-    projects_path = os.path.join(base_path, "projects")
-    os.makedirs(projects_path, exist_ok=True)
+    _write_if_missing(Path(base_path) / "logs" / "gooee.log", _LOG_HEADER)
+
+    # logs/ and projects/ already exist via create_standard_structure()
 
 
 # ---------------------------------------------------------------
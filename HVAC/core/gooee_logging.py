@@ -22,11 +22,16 @@ from __future__ import annotations
 import logging
 import os
 from logging.handlers import RotatingFileHandler
+from typing import Optional
 
 
 DEFAULT_LOG_NAME = "gooee"
 DEFAULT_LOG_FILE = "logs/gooee.log"
 
+# Configured default logger, cached after first get_logger() so the
+# log_* wrappers skip the getLogger lookup + configured-flag probe.
+_LOGGER: Optional[logging.Logger] = None
+
 
 def get_logger(name: str = DEFAULT_LOG_NAME) -> logging.Logger:
     """
@@ -34,10 +39,16 @@ def get_logger(name: str = DEFAULT_LOG_NAME) -> logging.Logger:
     Safe to call from ANY module.
     Logger is configured only once (singleton style).
     """
+    global _LOGGER
+
+    if _LOGGER is not None and name == DEFAULT_LOG_NAME:
+        return _LOGGER
 
     logger = logging.getLogger(name)
 
     if getattr(logger, "_gooee_configured", False):
+        if name == DEFAULT_LOG_NAME:
+            _LOGGER = logger
         return logger
 
     logger.setLevel(logging.DEBUG)
@@ -76,6 +87,9 @@ def get_logger(name: str = DEFAULT_LOG_NAME) -> logging.Logger:
 
     logger._gooee_configured = True
     logger.debug("Gooee logging system initialised.")
+
+    if name == DEFAULT_LOG_NAME:
+        _LOGGER = logger
     return logger
 
 
@@ -84,16 +98,19 @@ def get_logger(name: str = DEFAULT_LOG_NAME) -> logging.Logger:
 # ----------------------------------------------------------------------
 
 def log_info(msg: str):
-    get_logger().info(msg)
+    (_LOGGER or get_logger()).info(msg)
 
 
 def log_warn(msg: str):
-    get_logger().warning(msg)
+    (_LOGGER or get_logger()).warning(msg)
 
 
 def log_error(msg: str):
-    get_logger().error(msg)
+    (_LOGGER or get_logger()).error(msg)
 
 
 def log_debug(msg: str):
-    get_logger().debug(msg)
+    logger = _LOGGER or get_logger()
+    # Disabled DEBUG sites cost one level check
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(msg)
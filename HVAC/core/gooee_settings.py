@@ -15,17 +15,52 @@ Integrates with:
 
 from __future__ import annotations
 import os
-from typing import Any, Dict
+from functools import cache
+from pathlib import Path
+from typing import Any, Callable, Dict, NoReturn
 import tomllib
 
-def _load(self):
-    cfg = os.path.join(self.config_dir, "hvacgooee_config.toml")
-    with open(cfg, "rb") as f:
-        self._settings = tomllib.load(f)
+# TOML parser: native (rtoml) when installed, stdlib tomllib otherwise.
+# Both take the whole document as one str, and both report malformed
+# TOML as tomllib.TOMLDecodeError, whichever is installed.
+def _rtoml_parser(rtoml: Any) -> Callable[[str], Dict[str, Any]]:
+    loads = rtoml.loads
+    parse_error = rtoml.TomlParsingError
 
-# NOTE:
-# This module assumes TOML loading has already populated
-# self._settings as a nested dict.
+    def parse(text: str) -> Dict[str, Any]:
+        try:
+            return loads(text)
+        except parse_error as exc:
+            raise tomllib.TOMLDecodeError(str(exc)) from exc
+
+    return parse
+
+
+try:
+    import rtoml as _rtoml
+except ImportError:
+    _parse_toml = tomllib.loads
+else:
+    _parse_toml = _rtoml_parser(_rtoml)
+
+
+# ------------------------------------------------------------
+# Theme error helpers (cold path)
+# ------------------------------------------------------------
+# Key listings are formatted out of line, only once a lookup has
+# already failed; theme() itself stays lookups + return.
+
+def _raise_no_themes(loaded: Dict[str, Any]) -> NoReturn:
+    raise RuntimeError(
+        f"No [themes] table found in hvacgooee_config.toml. "
+        f"Loaded keys: {list(loaded.keys())}"
+    )
+
+
+def _raise_unknown_theme(theme_name: str, themes: Dict[str, Any]) -> NoReturn:
+    raise RuntimeError(
+        f"Theme '{theme_name}' not found. Available themes: {list(themes.keys())}"
+    )
 
 
 class GooeeSettings:
@@ -49,17 +84,19 @@ class GooeeSettings:
     def _load(self):
         """
         Load settings from hvacgooee_config.toml.
+
+        One read of the whole file, decoded once, parsed from memory.
         """
-        import tomllib
         cfg_path = os.path.join(self.config_dir, "hvacgooee_config.toml")
 
-        if not os.path.exists(cfg_path):
+        try:
+            raw = Path(cfg_path).read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Missing config file: {cfg_path}"
-            )
+            ) from None
 
-        with open(cfg_path, "rb") as f:
-            self._settings = tomllib.load(f)
+        self._settings = _parse_toml(raw.decode("utf-8"))
 
     # ------------------------------------------------------------
     # Public API
@@ -76,21 +113,18 @@ class GooeeSettings:
     # ------------------------------------------------------------
 
     def theme(self, name: str | None = None) -> dict:
+        # Resolved on every call (two dict lookups): settings may be
+        # edited in place, e.g. settings.get("ui")["theme"] = "x".
         ui = self._settings.get("ui", {})
         theme_name = name or ui.get("theme", "gooee_dark_brown")
 
         themes = self._settings.get("themes")
         if not isinstance(themes, dict):
-            raise RuntimeError(
-                f"No [themes] table found in hvacgooee_config.toml. "
-                f"Loaded keys: {list(self._settings.keys())}"
-            )
+            _raise_no_themes(self._settings)
 
         theme = themes.get(theme_name)
         if not isinstance(theme, dict):
-            raise RuntimeError(
-                f"Theme '{theme_name}' not found. Available themes: {list(themes.keys())}"
-            )
+            _raise_unknown_theme(theme_name, themes)
 
         return theme
 
@@ -99,18 +133,12 @@ class GooeeSettings:
 # Global Singleton Accessor
 # ------------------------------------------------------------
 
-_settings_instance: GooeeSettings | None = None
-
-
+@cache
 def settings() -> GooeeSettings:
     """
     Access the global GooeeSettings singleton.
-    """
-    global _settings_instance
-    if _settings_instance is None:
-        from pathlib import Path
 
-        base = Path(__file__).resolve().parents[1]
-        _settings_instance = GooeeSettings(str(base))
-
-    return _settings_instance
+    Built on first call; use settings.cache_clear() to force a reload.
+    """
+    base = Path(__file__).resolve().parents[1]
+    return GooeeSettings(str(base))
@@ -17,12 +17,13 @@ A snapshot includes:
 - App settings:
     • Simple key/value dict (theme, mode, units, etc.)
 - Materials database:
-    • As JSON string via MaterialsDatabase.to_json()
+    • As a plain dict via MaterialsDatabase.to_dict()
 
 Design Rules
 ------------
 - Pure backend: NO GUI, NO DXF, NO file I/O.
-  The caller is responsible for writing/reading the JSON string to disk.
+  The caller is responsible for writing/reading the JSON string to disk
+  (or opening the file handed to snapshot_write()).
 
 - JSON format is stable, human-readable, and versioned.
 
@@ -38,6 +39,8 @@ from HVAC.core.io.project_serializer import (
 snapshot = create_project_snapshot(building, plant, settings_dict, materials_db)
 json_str = snapshot_to_json(snapshot)
 # → caller writes json_str to a .gooee file
+# or, for large projects, stream straight to an open text file:
+snapshot_write(snapshot, fp)
 
 # Load:
 snapshot2 = snapshot_from_json(json_str)
@@ -47,53 +50,162 @@ building2, plant2 = snapshot2.restore_objects(materials_db, settings_dict)
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict, field
-from datetime import datetime
-from typing import Any, Dict, Tuple, Optional
-
-# Heat-loss + constructions
-from HVAC.heatloss.room_model.building_model import Building
-from HVAC.heatloss.room_model.room_model import Room, RoomElement, RoomOpening
-from heatloss.physics.constructions import (
-    Construction,
-    ConstructionLayer,
-)
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, NoReturn, Optional, TextIO, Tuple
+
+# Model classes are only needed to rebuild objects, so they are imported
+# inside the *_from_dict functions: parsing / inspecting a snapshot
+# never loads the building, construction or hydronics stacks.
+if TYPE_CHECKING:
+    # Heat-loss + constructions
+    from HVAC.heatloss.room_model.building_model import Building
+    from HVAC.heatloss.room_model.room_model import Room, RoomElement, RoomOpening
+    from HVAC.constructions.construction_builder import (
+        Construction,
+        ConstructionLayer,
+    )
 
-# Hydronics
-from HVAC.hydronics.network.hydronics_controller import (
-    HydronicPlant,
-    HydronicLeg,
-    HydronicSubleg,
-    HydronicEmitter,
-)
+    # Hydronics
+    from HVAC.hydronics.network.hydronics_controller import (
+        HydronicPlant,
+        HydronicLeg,
+        HydronicSubleg,
+        HydronicEmitter,
+    )
+
+    # Materials DB
+    from HVAC.core.materials.materials_database import MaterialsDatabase
+
+# JSON codec: native (orjson) when installed, stdlib json otherwise.
+# orjson only pretty-prints with a 2-space indent; other indents fall
+# back to stdlib json so the output shape always matches the request.
+#
+# Both back ends follow the same rules, so a document parses to the
+# same data whichever one wrote it:
+#   • NaN / ±Infinity are rejected (ValueError) — orjson would write
+#     null and silently lose the value
+#   • non-str dict keys (int, float, bool, None) become strings
+#   • text is written as UTF-8, non-ASCII characters unescaped
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+_STDLIB_DUMP_OPTS: Dict[str, Any] = {"ensure_ascii": False, "allow_nan": False}
+
+
+def _json_loads(text: str) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(text)
+        except _orjson.JSONDecodeError:
+            pass    # e.g. NaN literals in files older than the rules above
+    return json.loads(text)
+
+
+def _raise_non_finite(value: float) -> None:
+    # Same message as stdlib json with allow_nan=False
+    raise ValueError(
+        f"Out of range float values are not JSON compliant: {value!r}"
+    )
+
+
+def _reject_non_finite(data: Any) -> None:
+    """
+    Walk containers ahead of orjson, which has no allow_nan=False.
+    """
+    pending = [data]
+    while pending:
+        obj = pending.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                _raise_non_finite(obj)
+        elif isinstance(obj, dict):
+            pending.extend(obj.values())
+            pending.extend(k for k in obj if isinstance(k, float))
+        elif isinstance(obj, (list, tuple)):
+            pending.extend(obj)
+
+
+def _use_orjson(indent: Optional[int]) -> bool:
+    return _orjson is not None and (indent is None or indent == 2)
+
+
+def _json_dumps(data: Dict[str, Any], indent: Optional[int]) -> str:
+    if _use_orjson(indent):
+        _reject_non_finite(data)
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent is not None:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(data, option=option).decode("utf-8")
+    return json.dumps(data, indent=indent, **_STDLIB_DUMP_OPTS)
+
+
+# Snapshot schema written by this module.
+#   1.0 — materials as a nested JSON string under "materials_json"
+#   1.1 — materials as a plain dict under "materials";
+#         constructions store layers column-wise under "layer_arrays"
+#         ({field: [value per layer]}) instead of a "layers" list of
+#         per-layer dicts (still read);
+#         building["constructions"] pools each shared Construction once
+#         ({ref: construction dict}) and elements point into it with
+#         {"$ref": ref}
+_SCHEMA_VERSION = "1.1"
+
+
+# Snapshot timestamps: aware UTC now, formatted in one strftime call
+# (datetime.utcnow() is deprecated). Always carries microseconds.
+_ISO_UTC = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def _utc_iso() -> str:
+    return datetime.now(timezone.utc).strftime(_ISO_UTC)
 
-# Materials DB
-from HVAC.core.materials.materials_database import MaterialsDatabasefrom HVAC.gui_v3.
 
 # ---------------------------------------------------------------------------
 # Helper serializers — Building & Constructions
 # ---------------------------------------------------------------------------
 
 def construction_to_dict(con: Construction) -> Dict[str, Any]:
+    # Layers are written column-wise (one list per field) rather than
+    # one dict per layer.
     return {
-        "layers": [
-            {
-                "name": l.name,
-                "thickness_m": l.thickness_m,
-                "conductivity_W_mK": l.conductivity_W_mK,
-                "density_kg_m3": l.density_kg_m3,
-                "specific_heat_J_kgK": l.specific_heat_J_kgK,
-            }
-            for l in con.layers
-        ],
+        "layer_arrays": con.layer_arrays(),
         "internal_surface_resistance": con.internal_surface_resistance,
         "external_surface_resistance": con.external_surface_resistance,
         "bridging_fraction": con.bridging_fraction,
         "bridging_conductivity": con.bridging_conductivity,
         "mode": con.mode,
-    }from HVAC.gui_v3.
+    }
 
 def construction_from_dict(data: Dict[str, Any]) -> Construction:
+    from HVAC.constructions.construction_builder import (
+        Construction,
+        ConstructionLayer,
+    )
+
+    kwargs = dict(
+        internal_surface_resistance=data.get("internal_surface_resistance", 0.13),
+        external_surface_resistance=data.get("external_surface_resistance", 0.04),
+        bridging_fraction=data.get("bridging_fraction", 0.0),
+        bridging_conductivity=data.get("bridging_conductivity", 0.0),
+        mode=data.get("mode", "advanced"),
+    )
+
+    cols = data.get("layer_arrays")
+    if cols is not None:
+        return Construction.from_arrays(
+            cols["name"],
+            cols["thickness_m"],
+            cols["conductivity_W_mK"],
+            cols.get("density_kg_m3"),
+            cols.get("specific_heat_J_kgK"),
+            **kwargs,
+        )
+
+    # Older snapshots: one dict per layer
     layers = [
         ConstructionLayer(
             name=l.get("name", "layer"),
@@ -104,14 +216,7 @@ def construction_from_dict(data: Dict[str, Any]) -> Construction:
         )
         for l in data.get("layers", [])
     ]
-    return Construction(
-        layers=layers,
-        internal_surface_resistance=data.get("internal_surface_resistance", 0.13),
-        external_surface_resistance=data.get("external_surface_resistance", 0.04),
-        bridging_fraction=data.get("bridging_fraction", 0.0),
-        bridging_conductivity=data.get("bridging_conductivity", 0.0),
-        mode=data.get("mode", "advanced"),
-    )
+    return Construction(layers=layers, **kwargs)
 
 
 def opening_to_dict(op: RoomOpening) -> Dict[str, Any]:
@@ -124,18 +229,41 @@ def opening_to_dict(op: RoomOpening) -> Dict[str, Any]:
     }
 
 
-def element_to_dict(elem: RoomElement) -> Dict[str, Any]:
+# Construction pool used while serialising one building:
+#   id(Construction) → (ref, construction dict)
+# Shared Construction objects are written once under "constructions"
+# and elements point at them with {"$ref": ref}.
+ConstructionPool = Dict[int, Tuple[str, Dict[str, Any]]]
+
+
+def _construction_ref(con: Construction, pool: ConstructionPool) -> Dict[str, str]:
+    entry = pool.get(id(con))
+    if entry is None:
+        entry = (f"c_{len(pool)}", construction_to_dict(con))
+        pool[id(con)] = entry
+    return {"$ref": entry[0]}
+
+
+def element_to_dict(
+    elem: RoomElement, pool: Optional[ConstructionPool] = None
+) -> Dict[str, Any]:
+    con = elem.construction
     return {
-        "construction": construction_to_dict(elem.construction),
+        "construction": (
+            construction_to_dict(con) if pool is None
+            else _construction_ref(con, pool)
+        ),
         "area_m2": elem.area_m2,
         "openings": [opening_to_dict(o) for o in elem.openings],
     }
 
 
-def room_to_dict(room: Room) -> Dict[str, Any]:
+def room_to_dict(
+    room: Room, pool: Optional[ConstructionPool] = None
+) -> Dict[str, Any]:
     return {
         "name": room.name,
-        "elements": [element_to_dict(e) for e in room.elements],
+        "elements": [element_to_dict(e, pool) for e in room.elements],
         "ventilation_rate_ach": room.ventilation_rate_ach,
         "infiltration_rate_ach": room.infiltration_rate_ach,
         "volume_m3": room.volume_m3,
@@ -144,19 +272,73 @@ def room_to_dict(room: Room) -> Dict[str, Any]:
 
 
 def building_to_dict(b: Building) -> Dict[str, Any]:
+    pool: ConstructionPool = {}
+    rooms = [room_to_dict(r, pool) for r in b.rooms]
     return {
         "name": b.name,
         "mode": b.mode,
         "T_inside_design": b.T_inside_design,
         "T_outside_design": b.T_outside_design,
-        "rooms": [room_to_dict(r) for r in b.rooms],
+        "constructions": {ref: d for ref, d in pool.values()},
+        "rooms": rooms,
+    }
+
+
+def _raise_bad_construction_ref(
+    ref: Any, constructions: Optional[Dict[str, Construction]]
+) -> NoReturn:
+    if constructions is None:
+        raise ValueError(
+            f"Element construction {{'$ref': {ref!r}}} but no construction "
+            f"pool was supplied."
+        )
+    raise ValueError(
+        f"Unknown construction $ref {ref!r}. "
+        f"Pooled refs: {sorted(constructions)}"
+    )
+
+
+def _construction_pool_from_dict(data: Dict[str, Any]) -> Dict[str, Construction]:
+    # Each pooled construction is built once, however many elements use it
+    return {
+        ref: construction_from_dict(d)
+        for ref, d in data.get("constructions", {}).items()
     }
 
 
-def room_from_dict(data: Dict[str, Any]) -> Room:
+def _element_construction(
+    data: Dict[str, Any],
+    constructions: Optional[Dict[str, Construction]],
+) -> Construction:
+    """
+    An element's Construction: the pooled object for {"$ref": ...},
+    otherwise built from the inline dict (older snapshots).
+    """
+    ref = data.get("$ref")
+    if ref is None:
+        return construction_from_dict(data)
+
+    con = constructions.get(ref) if constructions is not None else None
+    if con is None:
+        _raise_bad_construction_ref(ref, constructions)
+    return con
+
+
+def room_from_dict(
+    data: Dict[str, Any],
+    constructions: Optional[Dict[str, Construction]] = None,
+) -> Room:
+    """
+    `constructions` holds the building's already-built pool; elements
+    that carry {"$ref": ...} share the pooled object. Inline
+    construction dicts (older snapshots) are built per element.
+    A $ref with no pool, or naming an unknown ref, raises ValueError.
+    """
+    from HVAC.heatloss.room_model.room_model import Room, RoomElement, RoomOpening
+
     elems = []
     for e in data.get("elements", []):
-        con = construction_from_dict(e["construction"])
+        con = _element_construction(e["construction"], constructions)
         openings = [
             RoomOpening(
                 area_m2=o["area_m2"],
@@ -184,7 +366,10 @@ def room_from_dict(data: Dict[str, Any]) -> Room:
 
 
 def building_from_dict(data: Dict[str, Any]) -> Building:
-    rooms = [room_from_dict(r) for r in data.get("rooms", [])]
+    from HVAC.heatloss.room_model.building_model import Building
+
+    constructions = _construction_pool_from_dict(data)
+    rooms = [room_from_dict(r, constructions) for r in data.get("rooms", [])]
     return Building(
         name=data.get("name", "Building"),
         rooms=rooms,
@@ -229,6 +414,8 @@ def plant_to_dict(p: HydronicPlant) -> Dict[str, Any]:
 
 
 def emitter_from_dict(d: Dict[str, Any]) -> HydronicEmitter:
+    from HVAC.hydronics.network.hydronics_controller import HydronicEmitter
+
     return HydronicEmitter(
         id=d["id"],
         flow_rate_lph=d["flow_rate_lph"],
@@ -238,6 +425,8 @@ def emitter_from_dict(d: Dict[str, Any]) -> HydronicEmitter:
 
 
 def subleg_from_dict(d: Dict[str, Any]) -> HydronicSubleg:
+    from HVAC.hydronics.network.hydronics_controller import HydronicSubleg
+
     return HydronicSubleg(
         id=d["id"],
         emitters=[emitter_from_dict(e) for e in d.get("emitters", [])],
@@ -245,6 +434,8 @@ def subleg_from_dict(d: Dict[str, Any]) -> HydronicSubleg:
 
 
 def leg_from_dict(d: Dict[str, Any]) -> HydronicLeg:
+    from HVAC.hydronics.network.hydronics_controller import HydronicLeg
+
     return HydronicLeg(
         id=d["id"],
         sublegs=[subleg_from_dict(s) for s in d.get("sublegs", [])],
@@ -252,6 +443,8 @@ def leg_from_dict(d: Dict[str, Any]) -> HydronicLeg:
 
 
 def plant_from_dict(d: Dict[str, Any]) -> HydronicPlant:
+    from HVAC.hydronics.network.hydronics_controller import HydronicPlant
+
     return HydronicPlant(
         id=d.get("id", "PLANT"),
         legs=[leg_from_dict(l) for l in d.get("legs", [])],
@@ -262,15 +455,15 @@ def plant_from_dict(d: Dict[str, Any]) -> HydronicPlant:
 # Snapshot Dataclass
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ProjectSnapshot:
     """
     A full HVACgooee project snapshot, ready for JSON serialisation.
 
     Note: This is a backend transport structure, not a runtime object.
     """
-    schema_version: str = "1.0"
-    created_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    schema_version: str = _SCHEMA_VERSION
+    created_utc: str = field(default_factory=_utc_iso)
 
     # Core project objects in dict form
     building: Dict[str, Any] = field(default_factory=dict)
@@ -278,7 +471,7 @@ class ProjectSnapshot:
 
     # Settings and materials
     settings: Dict[str, Any] = field(default_factory=dict)
-    materials_json: str = ""   # JSON string of MaterialsDatabase
+    materials: Dict[str, Any] = field(default_factory=dict)   # MaterialsDatabase.to_dict()
 
     # Optional free-form metadata
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -295,16 +488,16 @@ class ProjectSnapshot:
         """
         Recreate Building + HydronicPlant objects from the snapshot.
 
-        If a MaterialsDatabase is provided, we load materials_json into it
+        If a MaterialsDatabase is provided, we load materials into it
         (merge mode). If settings_target is provided, it is updated with
         snapshot settings.
         """
         b = building_from_dict(self.building)
         p = plant_from_dict(self.hydronic_plant)
 
-        if materials_db is not None and self.materials_json:
+        if materials_db is not None and self.materials:
             try:
-                materials_db.load_json(self.materials_json, overwrite=False)
+                materials_db.load_json(self.materials, overwrite=False)
             except Exception:
                 # Non-fatal: caller may choose to re-load separately
                 pass
@@ -334,24 +527,72 @@ def create_project_snapshot(
     """
     b_dict = building_to_dict(building)
     p_dict = plant_to_dict(plant)
-    mat_json = materials_db.to_json(indent=None)
+    materials = materials_db.to_dict()
 
     snap = ProjectSnapshot(
         building=b_dict,
         hydronic_plant=p_dict,
         settings=dict(settings),
-        materials_json=mat_json,
+        materials=materials,
         metadata=metadata or {},
     )
     return snap
 
 
+def _snapshot_to_data(snapshot: ProjectSnapshot) -> Dict[str, Any]:
+    # Fields are already JSON-ready, so they are emitted as-is (no
+    # asdict() deep copy before json walks them).
+    return {
+        "schema_version": snapshot.schema_version,
+        "created_utc": snapshot.created_utc,
+        "building": snapshot.building,
+        "hydronic_plant": snapshot.hydronic_plant,
+        "settings": snapshot.settings,
+        "materials": snapshot.materials,
+        "metadata": snapshot.metadata,
+    }
+
+
 def snapshot_to_json(snapshot: ProjectSnapshot, indent: int = 2) -> str:
     """
     Convert a ProjectSnapshot to JSON string.
     """
-    data = asdict(snapshot)
-    return json.dumps(data, indent=indent)
+    return _json_dumps(_snapshot_to_data(snapshot), indent)
+
+
+def snapshot_write(
+    snapshot: ProjectSnapshot, fp: TextIO, indent: Optional[int] = 2
+) -> None:
+    """
+    Write a ProjectSnapshot as JSON to an open text file.
+
+    Writes exactly the text snapshot_to_json(snapshot, indent) returns,
+    under the same codec rules. Without orjson (or with an indent
+    orjson cannot produce) stdlib json encodes chunk by chunk straight
+    into fp.write, so the whole document never exists as one string.
+    fp must accept non-ASCII text (open it with encoding="utf-8");
+    the caller opens and closes it.
+    """
+    data = _snapshot_to_data(snapshot)
+    if _use_orjson(indent):
+        fp.write(_json_dumps(data, indent))
+    else:
+        json.dump(data, fp, indent=indent, **_STDLIB_DUMP_OPTS)
+
+
+def _materials_from_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Materials dict from a parsed snapshot.
+
+    Older snapshots carry the database as a nested JSON string under
+    "materials_json"; it is decoded here so callers only see dicts.
+    """
+    materials = data.get("materials")
+    if materials is not None:
+        return materials
+
+    legacy = data.get("materials_json")
+    return _json_loads(legacy) if legacy else {}
 
 
 def snapshot_from_json(json_str: str) -> ProjectSnapshot:
@@ -361,13 +602,37 @@ def snapshot_from_json(json_str: str) -> ProjectSnapshot:
     Does not automatically re-create runtime objects; use
     snapshot.restore_objects(...) for that.
     """
-    data = json.loads(json_str)
+    data = _json_loads(json_str)
+
+    version = data.get("schema_version", "1.0")
+
+    # Fast path: a complete current-schema document as written by
+    # snapshot_to_json / snapshot_write — straight key reads, no defaults.
+    if version == _SCHEMA_VERSION:
+        try:
+            return ProjectSnapshot(
+                _SCHEMA_VERSION,
+                data["created_utc"],
+                data["building"],
+                data["hydronic_plant"],
+                data["settings"],
+                data["materials"],
+                data["metadata"],
+            )
+        except KeyError:
+            pass    # partial document: fill defaults below
+
+    # 1.0 documents are upgraded on read: materials_json is decoded
+    # into the 1.1 "materials" dict below.
+    if version == "1.0":
+        version = _SCHEMA_VERSION
+
     return ProjectSnapshot(
-        schema_version=data.get("schema_version", "1.0"),
-        created_utc=data.get("created_utc", datetime.utcnow().isoformat() + "Z"),
+        schema_version=version,
+        created_utc=data["created_utc"] if "created_utc" in data else _utc_iso(),
         building=data.get("building", {}),
         hydronic_plant=data.get("hydronic_plant", {}),
         settings=data.get("settings", {}),
-        materials_json=data.get("materials_json", ""),
+        materials=_materials_from_data(data),
         metadata=data.get("metadata", {}),
     )
@@ -1,5 +1,21 @@
+import io
 import os
 import csv
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+
+def _rows(text):
+    """
+    Split tab-separated text into rows of fields.
+
+    Plain numeric files are split with str.split (no per-char csv state
+    machine); anything containing quotes goes through csv.reader so
+    quoted fields still parse exactly as before.
+    """
+    if '"' in text:
+        return csv.reader(io.StringIO(text), delimiter="\t")
+    return (line.split("\t") for line in text.split("\n"))
 
 
 def load_material_csv(file_path):
@@ -10,8 +26,8 @@ def load_material_csv(file_path):
     data = []
     try:
         with open(file_path, "r") as f:
-            reader = csv.reader(f, delimiter="\t")
-            for row in reader:
+            text = f.read()
+            for row in _rows(text):
                 try:
                     numbers = [float(x) for x in row if x.strip()]
                     if numbers:
@@ -28,11 +44,39 @@ def build_pipe_mat_array(data_dir):
     """
     Load all pipe material files from a directory.
     Returns a dictionary mapping material names to their data.
+
+    The directory is parsed once per session (see _scan_pipe_mat_dir);
+    each call returns fresh lists, so callers may mutate the result.
+    Call clear_pipe_mat_cache() after changing files on disk.
     """
-    materials = {}
-    for fname in os.listdir(data_dir):
-        if fname.lower().endswith((".txt", ".csv")):
-            name, _ = os.path.splitext(fname)
-            path = os.path.join(data_dir, fname)
-            materials[name.capitalize()] = load_material_csv(path)
-    return materials
+    # Key the cache on the absolute path: a relative data_dir would
+    # otherwise keep serving the first directory after a chdir
+    return {
+        name: [list(row) for row in rows]
+        for name, rows in _scan_pipe_mat_dir(os.path.abspath(data_dir)).items()
+    }
+
+
+@lru_cache(maxsize=4)
+def _scan_pipe_mat_dir(data_dir):
+    files = []
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            fname = entry.name
+            if fname.lower().endswith((".txt", ".csv")) and entry.is_file():
+                name, _ = os.path.splitext(fname)
+                files.append((name.capitalize(), entry.path))
+
+    # Files are independent: overlap their reads on a thread pool.
+    # map() keeps directory order, so later duplicates still win.
+    if len(files) > 1:
+        with ThreadPoolExecutor() as pool:
+            loaded = list(pool.map(load_material_csv, [p for _, p in files]))
+    else:
+        loaded = [load_material_csv(p) for _, p in files]
+
+    return {name: data for (name, _), data in zip(files, loaded)}
+
+
+def clear_pipe_mat_cache():
+    _scan_pipe_mat_dir.cache_clear()
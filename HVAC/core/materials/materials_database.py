@@ -25,7 +25,9 @@ Future expansions:
 """
 
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional, List
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, List, Mapping, Union
 import json
 
 
@@ -33,8 +35,12 @@ import json
 # Data Structure
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Material:
+    """
+    Immutable: default instances are shared by every MaterialsDatabase;
+    to change a material, add() a new one under the same key.
+    """
     name: str
     lambda_W_mK: float                # thermal conductivity
     density_kg_m3: Optional[float]    # density
@@ -47,10 +53,14 @@ class Material:
 # Default Material Library (Legacy + Modern Mixed)
 # ---------------------------------------------------------------------------
 
-def default_materials() -> Dict[str, Material]:
+@cache
+def default_materials() -> Mapping[str, Material]:
     """
     Combined legacy + modern baseline materials.
     These are intentionally minimal — larger tables will be loaded via JSON.
+
+    Built once and returned as a read-only view; copy it (dict(...))
+    for a mutable table.
     """
     mats = {
         # --- Legacy environmental / CIBSE style entries ---
@@ -130,7 +140,7 @@ def default_materials() -> Dict[str, Material]:
             category="masonry",
         ),
     }
-    return mats
+    return MappingProxyType(mats)
 
 
 # ---------------------------------------------------------------------------
@@ -150,7 +160,8 @@ class MaterialsDatabase:
     """
 
     def __init__(self):
-        self._materials: Dict[str, Material] = default_materials()
+        # Own dict, shared (immutable) default Material instances
+        self._materials: Dict[str, Material] = dict(default_materials())
 
     # ----- Core API ---------------------------------------------------------
 
@@ -172,23 +183,33 @@ class MaterialsDatabase:
 
     # ----- JSON I/O ---------------------------------------------------------
 
-    def load_json(self, json_str: str, overwrite: bool = False) -> None:
+    def load_json(
+        self,
+        json_str: Union[str, Mapping[str, Any]],
+        overwrite: bool = False,
+    ) -> None:
         """
-        Load materials from a JSON string.
+        Load materials from a JSON string or an already-parsed dict
+        (as produced by to_dict()).
 
         If overwrite=True, replaces entire database.
         If overwrite=False, merges new keys (existing keys overridden).
         """
-        data = json.loads(json_str)
+        data = json.loads(json_str) if isinstance(json_str, str) else json_str
         if overwrite:
             self._materials = {}
 
         for key, mat_dict in data.items():
             self._materials[key] = Material(**mat_dict)
 
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Export current materials as a plain JSON-ready dict.
+        """
+        return {k: asdict(v) for k, v in self._materials.items()}
+
     def to_json(self, indent: int = 2) -> str:
         """
         Export current materials to JSON.
         """
-        data = {k: asdict(v) for k, v in self._materials.items()}
-        return json.dumps(data, indent=indent)
+        return json.dumps(self.to_dict(), indent=indent)
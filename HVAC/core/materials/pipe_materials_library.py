@@ -17,21 +17,32 @@ Contains:
         * get_roughness(material)
         * list_nominal_sizes(material)
         * nearest_size(material, inner_diameter)
+        * nearest_sizes(material, inner_diameters)   (batch)
+        * size_columns(material)                     (DN/OD/ID/t columns)
 
 These values match typical UK/EU HVAC design references (BSRIA, CIBSE).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+# Parallel per-size columns in `sizes` order: (dn, od_mm, id_mm, thickness_mm)
+PipeSizeColumns = Tuple[
+    Tuple[int, ...], Tuple[float, ...], Tuple[float, ...], Tuple[float, ...]
+]
 
 
 # ---------------------------------------------------------------------------
 # DATA CLASSES
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipeSize:
     dn: int             # DN15, DN20, etc
     od_mm: float        # outside diameter
@@ -39,13 +50,45 @@ class PipeSize:
     thickness_mm: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipeMaterial:
     name: str
     roughness_mm: float
     conductivity_W_mK: float
     density_kg_m3: float
-    sizes: Dict[int, PipeSize]   # key: DN (15, 20, 25, ...)
+    sizes: Mapping[int, PipeSize]   # key: DN (15, 20, 25, ...); read-only
+
+    # Derived search index for nearest_size(), built once from `sizes`:
+    # unique internal diameters ascending, with the DN (and its position
+    # in `sizes`) that first declared each one.
+    _ids_sorted: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _dns_by_id: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _order_by_id: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    # Size table as parallel columns (SoA), for solvers working across DN
+    _columns: PipeSizeColumns = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Reference data: freeze a private copy so the derived index
+        # below can never go stale (frozen dataclass: assign via object)
+        object.__setattr__(self, "sizes", MappingProxyType(dict(self.sizes)))
+
+        first: Dict[float, Tuple[int, int]] = {}
+        for pos, (dn, size) in enumerate(self.sizes.items()):
+            first.setdefault(size.id_mm, (pos, dn))
+
+        ids = sorted(first)
+        object.__setattr__(self, "_ids_sorted", tuple(ids))
+        object.__setattr__(self, "_dns_by_id", tuple(first[i][1] for i in ids))
+        object.__setattr__(self, "_order_by_id", tuple(first[i][0] for i in ids))
+
+        sizes = tuple(self.sizes.values())
+        object.__setattr__(self, "_columns", (
+            tuple(sz.dn for sz in sizes),
+            tuple(sz.od_mm for sz in sizes),
+            tuple(sz.id_mm for sz in sizes),
+            tuple(sz.thickness_mm for sz in sizes),
+        ))
 
 
 # ---------------------------------------------------------------------------
@@ -130,34 +173,42 @@ PVC_ABS = PipeMaterial(
 # MASTER LIBRARY
 # ---------------------------------------------------------------------------
 
-PIPE_LIBRARY = {
+PIPE_LIBRARY: Mapping[str, PipeMaterial] = MappingProxyType({
     "copper": COPPER_EN1057,
     "steel": STEEL_MEDIUM,
     "mlcp": MLCP,
     "pex": PEX_AL_PEX,
     "pvc": PVC_ABS,
-}
+})
+
+# Library order, materialised once
+_MATERIAL_NAMES: Tuple[str, ...] = tuple(PIPE_LIBRARY)
 
 
 # ---------------------------------------------------------------------------
 # LOOKUP FUNCTIONS
 # ---------------------------------------------------------------------------
+# The library is read-only, so lookups are memoised per material name
+# as passed in: the case-fold + dict probe runs once per spelling.
 
+@lru_cache(maxsize=64)
 def get_material(name: str) -> Optional[PipeMaterial]:
     return PIPE_LIBRARY.get(name.lower())
 
 
 def list_materials() -> List[str]:
-    return list(PIPE_LIBRARY.keys())
+    return list(_MATERIAL_NAMES)
 
 
 def list_nominal_sizes(material: str) -> List[int]:
     m = get_material(material)
     if not m:
         return []
-    return list(m.sizes.keys())
+    # DN column is precomputed in `sizes` order; hand out a fresh list
+    return list(m._columns[0])
 
 
+@lru_cache(maxsize=256)
 def get_internal_diameter(material: str, dn: int) -> Optional[float]:
     m = get_material(material)
     if not m:
@@ -167,6 +218,7 @@ def get_internal_diameter(material: str, dn: int) -> Optional[float]:
     return m.sizes[dn].id_mm
 
 
+@lru_cache(maxsize=64)
 def get_roughness(material: str) -> Optional[float]:
     m = get_material(material)
     if not m:
@@ -174,6 +226,45 @@ def get_roughness(material: str) -> Optional[float]:
     return m.roughness_mm
 
 
+def size_columns(material: str) -> Optional[PipeSizeColumns]:
+    """
+    Material's size table as (dn, od_mm, id_mm, thickness_mm) columns,
+    row i = i-th entry of `sizes`. None for an unknown material.
+    """
+    m = get_material(material)
+    if not m:
+        return None
+    return m._columns
+
+
+def _nearest_dn(m: PipeMaterial, id_mm: float) -> Optional[int]:
+    ids = m._ids_sorted
+    if not ids:
+        return None
+
+    # Only the neighbours either side of the insertion point can be nearest
+    i = bisect_left(ids, id_mm)
+    if i == 0:
+        j = 0
+    elif i == len(ids):
+        j = i - 1
+    else:
+        err_lo = id_mm - ids[i - 1]
+        err_hi = ids[i] - id_mm
+        if err_lo != err_hi:
+            j = i - 1 if err_lo < err_hi else i
+        else:
+            # Tie: the size declared first wins (as in a linear scan)
+            order = m._order_by_id
+            j = i - 1 if order[i - 1] < order[i] else i
+
+    # Non-finite targets (NaN / ±inf) match nothing
+    if not abs(ids[j] - id_mm) < 1e99:
+        return None
+
+    return m._dns_by_id[j]
+
+
 def nearest_size(material: str, id_mm: float) -> Optional[int]:
     """
     Returns DN nearest to a given inner diameter.
@@ -182,14 +273,17 @@ def nearest_size(material: str, id_mm: float) -> Optional[int]:
     m = get_material(material)
     if not m:
         return None
+    return _nearest_dn(m, id_mm)
 
-    best_dn = None
-    best_err = 1e99
-
-    for dn, size in m.sizes.items():
-        err = abs(size.id_mm - id_mm)
-        if err < best_err:
-            best_err = err
-            best_dn = dn
 
-    return best_dn
+def nearest_sizes(
+    material: str, id_mm_values: Iterable[float]
+) -> List[Optional[int]]:
+    """
+    Batch nearest_size(): one DN (or None) per inner diameter.
+    The material is resolved once for the whole batch.
+    """
+    m = get_material(material)
+    if not m:
+        return [None for _ in id_mm_values]
+    return [_nearest_dn(m, d) for d in id_mm_values]
@@ -0,0 +1,75 @@
+# ======================================================================
+# HVAC/core/tests/test_flow_units_v1.py
+# ======================================================================
+
+"""
+Flow unit batch-conversion tests.
+
+Purpose
+-------
+Prove that each flow_from_*_batch() column equals the matching scalar
+flow_from_*() result element by element (==, not a tolerance), that a
+negative flow anywhere in the batch raises ValueError, and that an
+empty batch returns three empty columns.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from HVAC.core.flow_units import (
+    flow_from_kg_s,
+    flow_from_kg_s_batch,
+    flow_from_l_s,
+    flow_from_l_s_batch,
+    flow_from_m3_h,
+    flow_from_m3_h_batch,
+)
+
+
+_PAIRS = [
+    (flow_from_m3_h, flow_from_m3_h_batch),
+    (flow_from_l_s, flow_from_l_s_batch),
+    (flow_from_kg_s, flow_from_kg_s_batch),
+]
+
+
+def _flows() -> list:
+    rng = random.Random(7)
+    return [0.0, 0.1, 1.5, 3.3, 12.7, 1e-9, 1e6] + [
+        rng.uniform(0.0, 50.0) for _ in range(200)
+    ]
+
+
+# ----------------------------------------------------------------------
+# Test: batch == scalar, element by element
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("scalar, batch", _PAIRS)
+@pytest.mark.parametrize("density_kg_m3", [1000.0, 1035.0, 998.2])
+def test_batch_matches_scalar(scalar, batch, density_kg_m3) -> None:
+    flows = _flows()
+
+    m3_h, l_s, kg_s = batch(flows, density_kg_m3=density_kg_m3)
+
+    expected = [scalar(q, density_kg_m3=density_kg_m3) for q in flows]
+    assert m3_h == [f.m3_h for f in expected]
+    assert l_s == [f.l_s for f in expected]
+    assert kg_s == [f.kg_s for f in expected]
+
+
+# ----------------------------------------------------------------------
+# Test: validation and empty input
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("scalar, batch", _PAIRS)
+def test_negative_flow_rejected(scalar, batch) -> None:
+    with pytest.raises(ValueError, match="non-negative"):
+        scalar(-0.5)
+    with pytest.raises(ValueError, match="non-negative"):
+        batch([1.0, 2.0, -0.5])
+
+
+@pytest.mark.parametrize("scalar, batch", _PAIRS)
+def test_empty_batch(scalar, batch) -> None:
+    assert batch([]) == ([], [], [])
@@ -0,0 +1,79 @@
+# ======================================================================
+# HVAC/core/tests/test_gooee_settings_v1.py
+# ======================================================================
+
+"""
+Settings loader tests.
+
+Purpose
+-------
+Prove that both TOML back ends (stdlib tomllib, rtoml through
+_rtoml_parser) load a valid config the same way and report malformed
+TOML as tomllib.TOMLDecodeError.
+
+The rtoml branch runs against the installed rtoml when available, and
+always against an rtoml-shaped parser (its own error type) so the
+error translation is exercised without the package.
+"""
+
+from __future__ import annotations
+
+import tomllib
+from types import SimpleNamespace
+
+import pytest
+
+import HVAC.core.gooee_settings as gs
+
+
+class _ForeignTomlError(ValueError):
+    pass
+
+
+def _foreign_loads(text: str) -> dict:
+    # rtoml-like: same data, its own exception type
+    try:
+        return tomllib.loads(text)
+    except tomllib.TOMLDecodeError as exc:
+        raise _ForeignTomlError(str(exc)) from None
+
+
+def _real_rtoml_parser():
+    rtoml = pytest.importorskip("rtoml")
+    return gs._rtoml_parser(rtoml)
+
+
+_PARSERS = {
+    "tomllib": lambda: tomllib.loads,
+    "rtoml-shaped": lambda: gs._rtoml_parser(
+        SimpleNamespace(loads=_foreign_loads, TomlParsingError=_ForeignTomlError)
+    ),
+    "rtoml": _real_rtoml_parser,
+}
+
+
+@pytest.fixture(params=list(_PARSERS))
+def parser(request, monkeypatch):
+    monkeypatch.setattr(gs, "_parse_toml", _PARSERS[request.param]())
+
+
+def _settings_from(tmp_path, text: str) -> gs.GooeeSettings:
+    config = tmp_path / "config"
+    config.mkdir()
+    (config / "hvacgooee_config.toml").write_text(text, encoding="utf-8")
+    return gs.GooeeSettings(str(tmp_path))
+
+
+def test_valid_config_loads(parser, tmp_path) -> None:
+    settings = _settings_from(
+        tmp_path,
+        '[ui]\ntheme = "slate"\n\n[themes.slate]\nbg = "#222"\n',
+    )
+
+    assert settings.get("ui") == {"theme": "slate"}
+    assert settings.theme() == {"bg": "#222"}
+
+
+def test_malformed_config_raises_toml_decode_error(parser, tmp_path) -> None:
+    with pytest.raises(tomllib.TOMLDecodeError):
+        _settings_from(tmp_path, "[ui\ntheme = \n")
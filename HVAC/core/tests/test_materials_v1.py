@@ -0,0 +1,55 @@
+# ======================================================================
+# HVAC/core/tests/test_materials_v1.py
+# ======================================================================
+
+"""
+Pipe material directory cache tests.
+
+Purpose
+-------
+build_pipe_mat_array() parses a directory once per session. The cache
+is keyed on the absolute path, so the same relative data_dir resolved
+from two working directories loads two different directories.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from HVAC.core.materials.materials import (
+    build_pipe_mat_array,
+    clear_pipe_mat_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_pipe_mat_cache()
+    yield
+    clear_pipe_mat_cache()
+
+
+def _project(root, value: str):
+    data = root / "data"
+    data.mkdir(parents=True)
+    (data / "copper.txt").write_text(f"{value}\t2.0\n")
+    return root
+
+
+def test_relative_dir_follows_working_directory(tmp_path, monkeypatch) -> None:
+    a = _project(tmp_path / "a", "1.0")
+    b = _project(tmp_path / "b", "5.0")
+
+    monkeypatch.chdir(a)
+    assert build_pipe_mat_array("data") == {"Copper": [[1.0, 2.0]]}
+
+    monkeypatch.chdir(b)
+    assert build_pipe_mat_array("data") == {"Copper": [[5.0, 2.0]]}
+
+
+def test_result_is_a_fresh_copy(tmp_path) -> None:
+    data = _project(tmp_path, "1.0") / "data"
+
+    build_pipe_mat_array(str(data))["Copper"][0][0] = 99.0
+
+    assert build_pipe_mat_array(str(data)) == {"Copper": [[1.0, 2.0]]}
@@ -0,0 +1,41 @@
+# ======================================================================
+# HVAC/core/tests/test_pipe_materials_library_v1.py
+# ======================================================================
+
+"""
+Pipe materials library immutability tests.
+
+Purpose
+-------
+Lookups are lru_cached and PipeMaterial builds its nearest-size index
+once in __post_init__, so library entries must be read-only: a write
+would otherwise leave cached results and the derived index stale.
+"""
+
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from HVAC.core.materials import pipe_materials_library as L
+
+
+def test_library_entries_are_frozen() -> None:
+    copper = L.COPPER_EN1057
+
+    with pytest.raises(FrozenInstanceError):
+        copper.roughness_mm = 0.1
+    with pytest.raises(FrozenInstanceError):
+        copper.sizes[15].id_mm = 99.0
+    with pytest.raises(TypeError):
+        copper.sizes[99] = L.PipeSize(99, 100.0, 99.0, 0.5)
+
+
+def test_derived_index_built_from_sizes() -> None:
+    copper = L.COPPER_EN1057
+    dns, _, ids, _ = L.size_columns("copper")
+
+    assert dns == tuple(copper.sizes)
+    assert ids == tuple(s.id_mm for s in copper.sizes.values())
+    assert L.nearest_size("copper", 13.4) == 15
@@ -0,0 +1,208 @@
+# ======================================================================
+# HVAC/core/tests/test_project_serializer_v1.py
+# ======================================================================
+
+"""
+Project serializer JSON round-trip tests.
+
+Purpose
+-------
+Prove that the orjson and stdlib json back ends follow the same rules:
+• NaN / Infinity are rejected, never written as null
+• Non-str dict keys are written as strings
+• Non-ASCII text survives a round trip unchanged
+
+Each test runs once per available back end.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from types import SimpleNamespace
+
+import pytest
+
+import HVAC.core.io.project_serializer as ps
+
+
+_BACKENDS = ["stdlib"] + (["orjson"] if ps._orjson is not None else [])
+
+
+@pytest.fixture(params=_BACKENDS)
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(ps, "_orjson", None)
+    return request.param
+
+
+def _snapshot(settings: dict) -> ps.ProjectSnapshot:
+    return ps.ProjectSnapshot(
+        created_utc="2026-01-01T00:00:00.000000Z",
+        settings=settings,
+        materials={"Brick": {"name": "Brick", "conductivity": 0.77}},
+    )
+
+
+# ----------------------------------------------------------------------
+# Test: round trip (both entry points)
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_round_trip_non_str_key_and_non_ascii(backend, indent) -> None:
+    snap = _snapshot({1: "one", "room": "Wohnzimmer – Größe"})
+
+    text = ps.snapshot_to_json(snap, indent=indent)
+    fp = io.StringIO()
+    ps.snapshot_write(snap, fp, indent=indent)
+
+    assert fp.getvalue() == text
+    assert "Größe" in text
+
+    back = ps.snapshot_from_json(text)
+    assert back.settings == {"1": "one", "room": "Wohnzimmer – Größe"}
+    assert back.materials == snap.materials
+
+
+# ----------------------------------------------------------------------
+# Test: non-finite floats
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_non_finite_rejected(backend, indent, value) -> None:
+    snap = _snapshot({"flow": [1.0, {"dp": value}]})
+
+    with pytest.raises(ValueError):
+        ps.snapshot_to_json(snap, indent=indent)
+    with pytest.raises(ValueError):
+        ps.snapshot_write(snap, io.StringIO(), indent=indent)
+
+
+def test_legacy_nan_literal_still_loads(backend) -> None:
+    snap = ps.snapshot_from_json('{"schema_version": "1.0", "settings": {"x": NaN}}')
+
+    assert math.isnan(snap.settings["x"])
+
+
+# ----------------------------------------------------------------------
+# Test: schema versions
+# ----------------------------------------------------------------------
+def test_new_snapshots_write_schema_1_1(backend) -> None:
+    text = ps.snapshot_to_json(_snapshot({}))
+
+    assert ps._json_loads(text)["schema_version"] == "1.1"
+    assert ps.snapshot_from_json(text).materials == _snapshot({}).materials
+
+
+def test_schema_1_0_materials_json_is_upgraded(backend) -> None:
+    legacy = (
+        '{"schema_version": "1.0", "created_utc": "2020-01-01T00:00:00Z",'
+        ' "building": {}, "hydronic_plant": {}, "settings": {},'
+        ' "materials_json": "{\\"Brick\\": {\\"conductivity\\": 0.77}}",'
+        ' "metadata": {}}'
+    )
+
+    snap = ps.snapshot_from_json(legacy)
+
+    assert snap.schema_version == "1.1"
+    assert snap.materials == {"Brick": {"conductivity": 0.77}}
+
+
+# ----------------------------------------------------------------------
+# Test: building construction pool ({"$ref": ...})
+# ----------------------------------------------------------------------
+def _shared_wall():
+    from HVAC.constructions.construction_builder import (
+        Construction,
+        ConstructionLayer,
+    )
+
+    return Construction(
+        layers=[
+            ConstructionLayer("brick", 0.102, 0.77),
+            ConstructionLayer("mineral wool", 0.14, 0.035),
+        ],
+        bridging_fraction=0.1,
+        bridging_conductivity=0.13,
+    )
+
+
+def _building(wall):
+    # Attribute stand-ins for the room model: building_to_dict only
+    # reads attributes.
+    def room(name):
+        element = SimpleNamespace(construction=wall, area_m2=10.0, openings=[])
+        return SimpleNamespace(
+            name=name, elements=[element], ventilation_rate_ach=0.5,
+            infiltration_rate_ach=0.1, volume_m3=30.0, mode="advanced",
+        )
+
+    return SimpleNamespace(
+        name="House", mode="advanced", T_inside_design=21.0,
+        T_outside_design=-3.0, rooms=[room("Lounge"), room("Kitchen")],
+    )
+
+
+def test_shared_construction_pooled_once_and_rebuilt_shared(backend) -> None:
+    wall = _shared_wall()
+    snap = ps.ProjectSnapshot(building=ps.building_to_dict(_building(wall)))
+
+    data = ps._json_loads(ps.snapshot_to_json(snap))["building"]
+
+    assert list(data["constructions"]) == ["c_0"]
+    refs = [r["elements"][0]["construction"] for r in data["rooms"]]
+    assert refs == [{"$ref": "c_0"}, {"$ref": "c_0"}]
+
+    pool = ps._construction_pool_from_dict(data)
+    rebuilt = [ps._element_construction(ref, pool) for ref in refs]
+    assert rebuilt[0] is rebuilt[1]
+    assert rebuilt[0] == wall
+
+
+def test_shared_construction_full_round_trip() -> None:
+    pytest.importorskip("HVAC.heatloss.room_model.building_model")
+
+    wall = _shared_wall()
+    text = ps.snapshot_to_json(
+        ps.ProjectSnapshot(building=ps.building_to_dict(_building(wall)))
+    )
+    building = ps.building_from_dict(ps.snapshot_from_json(text).building)
+
+    a, b = (room.elements[0].construction for room in building.rooms)
+    assert a is b
+    assert a == wall
+
+
+@pytest.mark.parametrize("pool", [None, {}])
+def test_construction_ref_without_pool_entry_raises(pool) -> None:
+    with pytest.raises(ValueError, match="c_7"):
+        ps._element_construction({"$ref": "c_7"}, pool)
+
+
+# ----------------------------------------------------------------------
+# Test: construction layer layout
+# ----------------------------------------------------------------------
+def test_construction_round_trips_through_layer_arrays(backend) -> None:
+    wall = _shared_wall()
+
+    data = ps._json_loads(ps._json_dumps(ps.construction_to_dict(wall), None))
+
+    assert "layers" not in data
+    assert data["layer_arrays"]["thickness_m"] == [0.102, 0.14]
+    assert ps.construction_from_dict(data) == wall
+
+
+def test_legacy_layers_list_still_loads() -> None:
+    wall = _shared_wall()
+    legacy = {
+        "layers": [
+            {"name": "brick", "thickness_m": 0.102, "conductivity_W_mK": 0.77},
+            {"name": "mineral wool", "thickness_m": 0.14, "conductivity_W_mK": 0.035},
+        ],
+        "internal_surface_resistance": wall.internal_surface_resistance,
+        "external_surface_resistance": wall.external_surface_resistance,
+        "bridging_fraction": 0.1,
+        "bridging_conductivity": 0.13,
+        "mode": "advanced",
+    }
+
+    assert ps.construction_from_dict(legacy) == wall
@@ -21,11 +21,24 @@ Education is explanatory only and never authoritative.
 
 from __future__ import annotations
 
-from typing import Tuple
+import sys
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, Tuple
 
-from HVAC.education.hydronics.concepts import HYDRONICS_CONCEPTS
-from HVAC.education.heatloss.concepts import HEATLOSS_CONCEPTS
-from HVAC.education.fenestration.concepts import FENESTRATION_CONCEPTS
+# Concept tables load on first use of their domain, not at import:
+# domain → (module, attribute)
+_SOURCES = {
+    "hydronics": ("HVAC.education.hydronics.concepts", "HYDRONICS_CONCEPTS"),
+    "heatloss": ("HVAC.education.heatloss.concepts", "HEATLOSS_CONCEPTS"),
+    "fenestration": ("HVAC.education.fenestration.concepts", "FENESTRATION_CONCEPTS"),
+}
+
+_ATTR_DOMAINS = {attr: domain for domain, (_, attr) in _SOURCES.items()}
+
+# Lowered keys are interned, as are the index keys, so lookups for the
+# small fixed set of domains / topics / modes compare by identity
+_intern = sys.intern
 
 
 # ----------------------------------------------------------------------
@@ -54,25 +67,61 @@ def resolve(
     (title, body_text)
     """
 
-    domain = domain.lower()
-    topic = topic.lower()
-    mode = mode.lower()
+    domain = _intern(domain.lower())
+    topic = _intern(topic.lower())
+    mode = _intern(mode.lower())
+
+    if domain in _SOURCES:
+        hit = _domain_index(domain).get((topic, mode))
+        if hit is not None:
+            return hit
+        # Misses keep the original walk (and its _missing() text)
+        return _resolve_from(_get_source(domain), domain, topic, mode)
 
-    if domain == "hydronics":
-        return _resolve_from(HYDRONICS_CONCEPTS, domain, topic, mode)
+    return _missing(domain, topic, mode)
 
-    if domain == "heatloss":
-        return _resolve_from(HEATLOSS_CONCEPTS, domain, topic, mode)
 
-    if domain == "fenestration":
-        return _resolve_from(FENESTRATION_CONCEPTS, domain, topic, mode)
+def __getattr__(name: str):
+    # Back-compat: HYDRONICS_CONCEPTS etc. stay importable from here,
+    # loaded (and then cached as real globals) on first access.
+    domain = _ATTR_DOMAINS.get(name)
+    if domain is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    return _missing(domain, topic, mode)
+    value = _get_source(domain)
+    globals()[name] = value
+    return value
 
 
 # ----------------------------------------------------------------------
 # Internal helpers
 # ----------------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _get_source(domain: str) -> dict:
+    module_name, attr = _SOURCES[domain]
+    return getattr(import_module(module_name), attr)
+
+
+@lru_cache(maxsize=None)
+def _domain_index(domain: str) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """
+    Flat (topic, mode) → (title, body) table for one domain, built on
+    the domain's first resolve. Holds exactly the pairs _resolve_from()
+    would answer with real content.
+    """
+    index: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for topic, topic_block in _get_source(domain).items():
+        if not topic_block:
+            continue
+        for mode, entry in topic_block.items():
+            if entry and isinstance(entry, dict):
+                index[(_intern(topic), _intern(mode))] = (
+                    entry.get("title", "Education"),
+                    entry.get("body", ""),
+                )
+    return index
+
+
 def _resolve_from(
     source: dict,
     domain: str,